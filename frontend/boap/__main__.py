@@ -1,12 +1,14 @@
 """Application entry point."""
 
 import argparse
+import logging
 import sys
+import threading
 
-from .acp import initialize_acp_stack
 from .acp.gateway_thread import Gateway, LocalRouting
 from .acp.keepalive_thread import Keepalive
 from .acp.messages import BoapAcpMsgId
+from .acp.stack import BoapAcp
 from .gui import BoapGui
 
 
@@ -15,17 +17,27 @@ def main() -> int:
     # Parse command line arguments
     opts = parse_args()
 
+    # No log format used shows thread or process details, skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Initialize the GUI
     gui = BoapGui(opts.debug)
 
-    # Initialize the ACP stack
-    initialize_acp_stack(opts.port, opts.baud)
+    # Report worker thread crashes in the log panel
+    threading.excepthook = log_uncaught_thread_exception
+
+    # Initialize the ACP stack (after the GUI so that its logs are shown)
+    acp_stack = BoapAcp(opts.port, opts.baud)
+    gui.attach_acp_stack(acp_stack)
 
     # Start the keepalive thread
-    keepalive = Keepalive()
+    keepalive = Keepalive(acp_stack)
 
     # Start the gateway thread
     Gateway(
+        acp_stack,
         [
             LocalRouting(
                 keepalive.get_message_queue(),
@@ -50,13 +62,26 @@ def main() -> int:
                 gui.get_control_panel_trace_enable_message_queue(),
                 [BoapAcpMsgId.BOAP_ACP_BALL_TRACE_ENABLE],
             ),
-        ]
+        ],
     )
 
     # Run the PyQt event loop
     return gui.run()
 
 
+def log_uncaught_thread_exception(args: threading.ExceptHookArgs) -> None:
+    """Log an exception that terminated a thread."""
+    if issubclass(args.exc_type, SystemExit):
+        # Silently ignored by the default hook as well
+        return
+    thread_name = args.thread.name if args.thread else "unknown"
+    logging.getLogger("boap-gui-logger").critical(
+        "Thread %s terminated by an uncaught exception",
+        thread_name,
+        exc_info=args.exc_value,
+    )
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser()
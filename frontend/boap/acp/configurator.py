@@ -1,8 +1,9 @@
 """Plant configurator service."""
 
-import copy
+import functools
 import logging
-from queue import Queue
+import struct
+from typing import Callable, List, Tuple
 
 from ..defs import (
     BoapAcpTransactionError,
@@ -12,10 +13,10 @@ from ..defs import (
     EBoapRet_Ok,
     PlantSettings,
 )
-from . import get_acp_stack_handle
+from .message_queue import MessageQueue
 from .messages import (
+    BoapAcpMsg,
     BoapAcpMsgId,
-    BoapAcpMsgPayload,
     BoapAcpNodeId,
     SBoapAcpGetFilterOrderReq,
     SBoapAcpGetFilterOrderResp,
@@ -29,54 +30,82 @@ from .messages import (
     SBoapAcpSetSamplingPeriodReq,
     SBoapAcpSetSamplingPeriodResp,
 )
-from .transaction_runner import TransactionRunner
+from .stack import BoapAcp
+from .transaction_runner import ResponseKey, TransactionRunner
+
+# Human-readable axis names for logging
+_AXIS_LABEL = {EBoapAxis_X: "X-axis", EBoapAxis_Y: "Y-axis"}
+
+# Settings travel to the plant as float32, so compare them at that precision
+_PID_GAINS_LAYOUT = struct.Struct("<fff")
+_F32_LAYOUT = struct.Struct("<f")
 
 
 class PlantConfigurator:
     """BOAP plant configurator."""
 
-    def __init__(self, msg_queue: Queue, receive_timeout: float) -> None:
+    def __init__(
+        self,
+        acp_stack: BoapAcp,
+        msg_queue: MessageQueue,
+        receive_timeout: float,
+    ) -> None:
         """Initialize the configurator."""
         self.log = logging.getLogger("boap-gui-logger")
-        self.transaction_runner = TransactionRunner(msg_queue, receive_timeout)
+        self.acp_stack = acp_stack
+        self.transaction_runner = TransactionRunner(
+            acp_stack, msg_queue, receive_timeout
+        )
 
     def fetch_current_settings(self) -> PlantSettings:
         """Fetch current configuration from the plant."""
         # Start with defaults
         current_settings = PlantSettings()
-        try:
-            # Fetch X-axis PID settings
-            resp_payload = self.__fetch_pid_settings(EBoapAxis_X)
-            assert isinstance(resp_payload, SBoapAcpGetPidSettingsResp)
-            current_settings.XAxis.ProportionalGain = (
-                resp_payload.ProportionalGain
-            )
-            current_settings.XAxis.IntegralGain = resp_payload.IntegralGain
-            current_settings.XAxis.DerivativeGain = resp_payload.DerivativeGain
-
-            # Fetch Y-axis PID settings
-            resp_payload = self.__fetch_pid_settings(EBoapAxis_Y)
-            assert isinstance(resp_payload, SBoapAcpGetPidSettingsResp)
-            current_settings.YAxis.ProportionalGain = (
-                resp_payload.ProportionalGain
+
+        # Build all the requests along with the handlers of the responses
+        transactions: List[
+            Tuple[BoapAcpMsg, ResponseKey, Callable[..., None]]
+        ] = []
+        axes = (
+            (EBoapAxis_X, current_settings.XAxis),
+            (EBoapAxis_Y, current_settings.YAxis),
+        )
+
+        for axis, axis_settings in axes:
+            transactions.append(
+                (
+                    self.__create_get_pid_settings_request(axis),
+                    (BoapAcpMsgId.BOAP_ACP_GET_PID_SETTINGS_RESP, axis),
+                    functools.partial(
+                        self.__handle_get_pid_settings_resp, axis_settings
+                    ),
+                )
             )
-            current_settings.YAxis.IntegralGain = resp_payload.IntegralGain
-            current_settings.YAxis.DerivativeGain = resp_payload.DerivativeGain
 
-            # Fetch X-axis filter order
-            resp_payload = self.__fetch_filter_order(EBoapAxis_X)
-            assert isinstance(resp_payload, SBoapAcpGetFilterOrderResp)
-            current_settings.XAxis.FilterOrder = resp_payload.FilterOrder
+        for axis, axis_settings in axes:
+            transactions.append(
+                (
+                    self.__create_get_filter_order_request(axis),
+                    (BoapAcpMsgId.BOAP_ACP_GET_FILTER_ORDER_RESP, axis),
+                    functools.partial(
+                        self.__handle_get_filter_order_resp, axis_settings
+                    ),
+                )
+            )
 
-            # Fetch Y-axis filter order
-            resp_payload = self.__fetch_filter_order(EBoapAxis_Y)
-            assert isinstance(resp_payload, SBoapAcpGetFilterOrderResp)
-            current_settings.YAxis.FilterOrder = resp_payload.FilterOrder
+        transactions.append(
+            (
+                self.__create_get_sampling_period_request(),
+                (BoapAcpMsgId.BOAP_ACP_GET_SAMPLING_PERIOD_RESP, None),
+                functools.partial(
+                    self.__handle_get_sampling_period_resp, current_settings
+                ),
+            )
+        )
 
-            # Fetch sampling period
-            resp_payload = self.__fetch_sampling_period()
-            assert isinstance(resp_payload, SBoapAcpGetSamplingPeriodResp)
-            current_settings.SamplingPeriod = resp_payload.SamplingPeriod
+        try:
+            # Fetch all the settings in a single pipelined batch
+            self.transaction_runner.run_transactions(transactions)
 
             self.log.info("Plant settings fetched successfully")
 
@@ -90,140 +119,82 @@ class PlantConfigurator:
         self, current_settings: PlantSettings, new_settings: PlantSettings
     ) -> PlantSettings:
         """Run plantside configuration."""
-        acked_settings = copy.deepcopy(current_settings)
+        acked_settings = current_settings.clone()
 
-        try:
-            if self.__pid_settings_change_required(
-                current_settings.XAxis, new_settings.XAxis
-            ):
-                self.log.info(
-                    "Setting X-axis PID settings to:"
-                    + f" kp={new_settings.XAxis.ProportionalGain}"
-                    + f" ki={new_settings.XAxis.IntegralGain}"
-                    + f" kd={new_settings.XAxis.DerivativeGain}..."
-                )
-                resp_payload = self.__configure_pid_settings(
-                    EBoapAxis_X, new_settings.XAxis
-                )
-                assert isinstance(resp_payload, SBoapAcpSetPidSettingsResp)
-                self.log.info(
-                    "X-axis PID settings set to:"
-                    + f" kp={resp_payload.NewProportionalGain}"
-                    + f" ki={resp_payload.NewIntegralGain}"
-                    + f" kd={resp_payload.NewDerivativeGain}..."
-                )
-                acked_settings.XAxis.ProportionalGain = (
-                    resp_payload.NewProportionalGain
-                )
-                acked_settings.XAxis.IntegralGain = (
-                    resp_payload.NewIntegralGain
-                )
-                acked_settings.XAxis.DerivativeGain = (
-                    resp_payload.NewDerivativeGain
-                )
+        # Build all the requests required along with the handlers
+        # of the respective acknowledgements
+        transactions: List[
+            Tuple[BoapAcpMsg, ResponseKey, Callable[..., None]]
+        ] = []
+        axes = (
+            (
+                EBoapAxis_X,
+                _AXIS_LABEL[EBoapAxis_X],
+                current_settings.XAxis,
+                new_settings.XAxis,
+                acked_settings.XAxis,
+            ),
+            (
+                EBoapAxis_Y,
+                _AXIS_LABEL[EBoapAxis_Y],
+                current_settings.YAxis,
+                new_settings.YAxis,
+                acked_settings.YAxis,
+            ),
+        )
 
-            if self.__pid_settings_change_required(
-                current_settings.YAxis, new_settings.YAxis
-            ):
-                self.log.info(
-                    "Setting Y-axis PID settings to:"
-                    + f" kp={new_settings.YAxis.ProportionalGain}"
-                    + f" ki={new_settings.YAxis.IntegralGain}"
-                    + f" kd={new_settings.YAxis.DerivativeGain}..."
-                )
-                resp_payload = self.__configure_pid_settings(
-                    EBoapAxis_Y, new_settings.YAxis
-                )
-                assert isinstance(resp_payload, SBoapAcpSetPidSettingsResp)
-                self.log.info(
-                    "Y-axis PID settings set to:"
-                    + f" kp={resp_payload.NewProportionalGain}"
-                    + f" ki={resp_payload.NewIntegralGain}"
-                    + f" kd={resp_payload.NewDerivativeGain}..."
-                )
-                acked_settings.YAxis.ProportionalGain = (
-                    resp_payload.NewProportionalGain
-                )
-                acked_settings.YAxis.IntegralGain = (
-                    resp_payload.NewIntegralGain
-                )
-                acked_settings.YAxis.DerivativeGain = (
-                    resp_payload.NewDerivativeGain
+        for axis, axis_name, current_axis, new_axis, acked_axis in axes:
+            if self.__pid_settings_change_required(current_axis, new_axis):
+                transactions.append(
+                    (
+                        self.__create_pid_settings_request(axis, new_axis),
+                        (BoapAcpMsgId.BOAP_ACP_SET_PID_SETTINGS_RESP, axis),
+                        functools.partial(
+                            self.__handle_pid_settings_ack,
+                            axis_name,
+                            acked_axis,
+                        ),
+                    )
                 )
 
+        for axis, axis_name, current_axis, new_axis, acked_axis in axes:
             if self.__filter_order_change_required(
-                current_settings.XAxis.FilterOrder,
-                new_settings.XAxis.FilterOrder,
+                current_axis.FilterOrder, new_axis.FilterOrder
             ):
-                self.log.info(
-                    "Setting X-axis fiter order to"
-                    + f" {new_settings.XAxis.FilterOrder}..."
-                )
-                resp_payload = self.__configure_filter_order(
-                    EBoapAxis_X, new_settings.XAxis.FilterOrder
-                )
-                assert isinstance(resp_payload, SBoapAcpSetFilterOrderResp)
-                if EBoapRet_Ok == resp_payload.Status:
-                    self.log.info(
-                        "X-axis filter order changed from"
-                        + f" {resp_payload.OldFilterOrder}"
-                        + f" to {resp_payload.NewFilterOrder}"
-                    )
-                    acked_settings.XAxis.FilterOrder = (
-                        resp_payload.NewFilterOrder
-                    )
-                else:
-                    self.log.warning(
-                        "Failed to change X-axis filter order to"
-                        + f" {new_settings.XAxis.FilterOrder}. Filter remains"
-                        + f" of order {resp_payload.OldFilterOrder}"
+                transactions.append(
+                    (
+                        self.__create_filter_order_request(
+                            axis, new_axis.FilterOrder
+                        ),
+                        (BoapAcpMsgId.BOAP_ACP_SET_FILTER_ORDER_RESP, axis),
+                        functools.partial(
+                            self.__handle_filter_order_ack,
+                            axis_name,
+                            new_axis.FilterOrder,
+                            acked_axis,
+                        ),
                     )
-
-            if self.__filter_order_change_required(
-                current_settings.YAxis.FilterOrder,
-                new_settings.YAxis.FilterOrder,
-            ):
-                self.log.info(
-                    "Setting Y-axis fiter order to"
-                    + f" {new_settings.YAxis.FilterOrder}..."
-                )
-                resp_payload = self.__configure_filter_order(
-                    EBoapAxis_Y, new_settings.YAxis.FilterOrder
                 )
-                assert isinstance(resp_payload, SBoapAcpSetFilterOrderResp)
-                if EBoapRet_Ok == resp_payload.Status:
-                    self.log.info(
-                        "Y-axis filter order changed from"
-                        + f" {resp_payload.OldFilterOrder}"
-                        + f" to {resp_payload.NewFilterOrder}"
-                    )
-                    acked_settings.YAxis.FilterOrder = (
-                        resp_payload.NewFilterOrder
-                    )
-                else:
-                    self.log.warning(
-                        "Failed to change Y-axis filter order to"
-                        + f" {new_settings.YAxis.FilterOrder}. Filter remains"
-                        + f" of order {resp_payload.OldFilterOrder}"
-                    )
 
-            if self.__sampling_period_change_required(
-                current_settings.SamplingPeriod, new_settings.SamplingPeriod
-            ):
-                self.log.info(
-                    "Setting sampling period to"
-                    + f" {new_settings.SamplingPeriod}..."
-                )
-                resp_payload = self.__configure_sampling_period(
-                    new_settings.SamplingPeriod
+        if self.__sampling_period_change_required(
+            current_settings.SamplingPeriod, new_settings.SamplingPeriod
+        ):
+            transactions.append(
+                (
+                    self.__create_sampling_period_request(
+                        new_settings.SamplingPeriod
+                    ),
+                    (BoapAcpMsgId.BOAP_ACP_SET_SAMPLING_PERIOD_RESP, None),
+                    functools.partial(
+                        self.__handle_sampling_period_ack, acked_settings
+                    ),
                 )
-                assert isinstance(resp_payload, SBoapAcpSetSamplingPeriodResp)
-                self.log.info(
-                    "Sampling period changed from"
-                    + f" {resp_payload.OldSamplingPeriod}"
-                    + f" to {resp_payload.NewSamplingPeriod}"
-                )
-                acked_settings.SamplingPeriod = resp_payload.NewSamplingPeriod
+            )
+
+        try:
+            # Pipeline the requests and apply every acknowledgement that
+            # arrives, even if some others do not
+            self.transaction_runner.run_transactions(transactions)
 
         except BoapAcpTransactionError as e:
             self.log.error(str(e))
@@ -231,50 +202,132 @@ class PlantConfigurator:
 
         return acked_settings
 
-    def __fetch_pid_settings(self, axis: EBoapAxis) -> BoapAcpMsgPayload:
-        """Fetch PID settings from the plant."""
+    def __handle_pid_settings_ack(
+        self,
+        axis_name: str,
+        acked_axis: PlantSettings.AxisSettings,
+        resp_payload: SBoapAcpSetPidSettingsResp,
+    ) -> None:
+        """Handle PID settings acknowledgement."""
+        self.log.info(
+            "%s PID settings set to: kp=%s ki=%s kd=%s...",
+            axis_name,
+            resp_payload.NewProportionalGain,
+            resp_payload.NewIntegralGain,
+            resp_payload.NewDerivativeGain,
+        )
+        acked_axis.ProportionalGain = resp_payload.NewProportionalGain
+        acked_axis.IntegralGain = resp_payload.NewIntegralGain
+        acked_axis.DerivativeGain = resp_payload.NewDerivativeGain
+
+    def __handle_filter_order_ack(
+        self,
+        axis_name: str,
+        requested_filter_order: int,
+        acked_axis: PlantSettings.AxisSettings,
+        resp_payload: SBoapAcpSetFilterOrderResp,
+    ) -> None:
+        """Handle filter order acknowledgement."""
+        if EBoapRet_Ok == resp_payload.Status:
+            self.log.info(
+                "%s filter order changed from %s to %s",
+                axis_name,
+                resp_payload.OldFilterOrder,
+                resp_payload.NewFilterOrder,
+            )
+            acked_axis.FilterOrder = resp_payload.NewFilterOrder
+        else:
+            self.log.warning(
+                "Failed to change %s filter order to %s."
+                + " Filter remains of order %s",
+                axis_name,
+                requested_filter_order,
+                resp_payload.OldFilterOrder,
+            )
+
+    def __handle_sampling_period_ack(
+        self,
+        acked_settings: PlantSettings,
+        resp_payload: SBoapAcpSetSamplingPeriodResp,
+    ) -> None:
+        """Handle sampling period acknowledgement."""
+        self.log.info(
+            "Sampling period changed from %s to %s",
+            resp_payload.OldSamplingPeriod,
+            resp_payload.NewSamplingPeriod,
+        )
+        acked_settings.SamplingPeriod = resp_payload.NewSamplingPeriod
+
+    def __handle_get_pid_settings_resp(
+        self,
+        axis_settings: PlantSettings.AxisSettings,
+        resp_payload: SBoapAcpGetPidSettingsResp,
+    ) -> None:
+        """Handle fetched PID settings."""
+        self.log.debug(
+            "Fetched %s PID settings: kp=%s ki=%s kd=%s",
+            _AXIS_LABEL[resp_payload.AxisId],
+            resp_payload.ProportionalGain,
+            resp_payload.IntegralGain,
+            resp_payload.DerivativeGain,
+        )
+        axis_settings.ProportionalGain = resp_payload.ProportionalGain
+        axis_settings.IntegralGain = resp_payload.IntegralGain
+        axis_settings.DerivativeGain = resp_payload.DerivativeGain
+
+    def __handle_get_filter_order_resp(
+        self,
+        axis_settings: PlantSettings.AxisSettings,
+        resp_payload: SBoapAcpGetFilterOrderResp,
+    ) -> None:
+        """Handle fetched filter order."""
         self.log.debug(
-            "Fetching %s PID settings from plant..."
-            % ("X-axis" if EBoapAxis_X == axis else "Y-axis")
+            "Fetched %s filter order: %s",
+            _AXIS_LABEL[resp_payload.AxisId],
+            resp_payload.FilterOrder,
         )
-        request = get_acp_stack_handle().msg_create(
+        axis_settings.FilterOrder = resp_payload.FilterOrder
+
+    def __handle_get_sampling_period_resp(
+        self,
+        current_settings: PlantSettings,
+        resp_payload: SBoapAcpGetSamplingPeriodResp,
+    ) -> None:
+        """Handle fetched sampling period."""
+        self.log.debug(
+            "Fetched sampling period: %s", resp_payload.SamplingPeriod
+        )
+        current_settings.SamplingPeriod = resp_payload.SamplingPeriod
+
+    def __create_get_pid_settings_request(self, axis: EBoapAxis) -> BoapAcpMsg:
+        """Create a request to fetch PID settings from the plant."""
+        request = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_GET_PID_SETTINGS_REQ,
         )
         req_payload = request.get_payload()
         assert isinstance(req_payload, SBoapAcpGetPidSettingsReq)
         req_payload.AxisId = axis
-        return self.transaction_runner.run_transaction(
-            request, BoapAcpMsgId.BOAP_ACP_GET_PID_SETTINGS_RESP
-        )
+        return request
 
-    def __fetch_filter_order(self, axis: EBoapAxis) -> BoapAcpMsgPayload:
-        """Fetch filter order from the plant."""
-        self.log.debug(
-            "Fetching %s filter order from plant..."
-            % ("X-axis" if EBoapAxis_X == axis else "Y-axis")
-        )
-        request = get_acp_stack_handle().msg_create(
+    def __create_get_filter_order_request(self, axis: EBoapAxis) -> BoapAcpMsg:
+        """Create a request to fetch filter order from the plant."""
+        request = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_GET_FILTER_ORDER_REQ,
         )
         req_payload = request.get_payload()
         assert isinstance(req_payload, SBoapAcpGetFilterOrderReq)
         req_payload.AxisId = axis
-        return self.transaction_runner.run_transaction(
-            request, BoapAcpMsgId.BOAP_ACP_GET_FILTER_ORDER_RESP
-        )
+        return request
 
-    def __fetch_sampling_period(self) -> BoapAcpMsgPayload:
-        """Fetch sampling period from the plant."""
-        self.log.debug("Fetching sampling period from plant...")
-        request = get_acp_stack_handle().msg_create(
+    def __create_get_sampling_period_request(self) -> BoapAcpMsg:
+        """Create a request to fetch sampling period from the plant."""
+        request = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_GET_SAMPLING_PERIOD_REQ,
         )
-        return self.transaction_runner.run_transaction(
-            request, BoapAcpMsgId.BOAP_ACP_GET_SAMPLING_PERIOD_RESP
-        )
+        return request
 
     def __pid_settings_change_required(
         self,
@@ -282,10 +335,14 @@ class PlantConfigurator:
         new_settings: PlantSettings.AxisSettings,
     ) -> bool:
         """Test if change to PID settings is needed."""
-        return (
-            current_settings.ProportionalGain != new_settings.ProportionalGain
-            or current_settings.IntegralGain != new_settings.IntegralGain
-            or current_settings.DerivativeGain != new_settings.DerivativeGain
+        return _PID_GAINS_LAYOUT.pack(
+            current_settings.ProportionalGain,
+            current_settings.IntegralGain,
+            current_settings.DerivativeGain,
+        ) != _PID_GAINS_LAYOUT.pack(
+            new_settings.ProportionalGain,
+            new_settings.IntegralGain,
+            new_settings.DerivativeGain,
         )
 
     def __filter_order_change_required(
@@ -298,13 +355,15 @@ class PlantConfigurator:
         self, currentSamplingPeriod: float, newSamplingPeriod: float
     ) -> bool:
         """Test if change to the sampling period is needed."""
-        return currentSamplingPeriod != newSamplingPeriod
+        return _F32_LAYOUT.pack(currentSamplingPeriod) != _F32_LAYOUT.pack(
+            newSamplingPeriod
+        )
 
-    def __configure_pid_settings(
+    def __create_pid_settings_request(
         self, axis: EBoapAxis, settings: PlantSettings.AxisSettings
-    ) -> BoapAcpMsgPayload:
-        """Configure PID settings plantside."""
-        request = get_acp_stack_handle().msg_create(
+    ) -> BoapAcpMsg:
+        """Create a plantside PID settings change request."""
+        request = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_SET_PID_SETTINGS_REQ,
         )
@@ -314,15 +373,13 @@ class PlantConfigurator:
         req_payload.ProportionalGain = settings.ProportionalGain
         req_payload.IntegralGain = settings.IntegralGain
         req_payload.DerivativeGain = settings.DerivativeGain
-        return self.transaction_runner.run_transaction(
-            request, BoapAcpMsgId.BOAP_ACP_SET_PID_SETTINGS_RESP
-        )
+        return request
 
-    def __configure_filter_order(
+    def __create_filter_order_request(
         self, axis: EBoapAxis, filterOrder: int
-    ) -> BoapAcpMsgPayload:
-        """Configure filter order plantside."""
-        request = get_acp_stack_handle().msg_create(
+    ) -> BoapAcpMsg:
+        """Create a plantside filter order change request."""
+        request = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_SET_FILTER_ORDER_REQ,
         )
@@ -330,21 +387,17 @@ class PlantConfigurator:
         assert isinstance(req_payload, SBoapAcpSetFilterOrderReq)
         req_payload.AxisId = axis
         req_payload.FilterOrder = filterOrder
-        return self.transaction_runner.run_transaction(
-            request, BoapAcpMsgId.BOAP_ACP_SET_FILTER_ORDER_RESP
-        )
+        return request
 
-    def __configure_sampling_period(
+    def __create_sampling_period_request(
         self, samplingPeriod: float
-    ) -> BoapAcpMsgPayload:
-        """Configure sampling period plantside."""
-        request = get_acp_stack_handle().msg_create(
+    ) -> BoapAcpMsg:
+        """Create a plantside sampling period change request."""
+        request = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_SET_SAMPLING_PERIOD_REQ,
         )
         req_payload = request.get_payload()
         assert isinstance(req_payload, SBoapAcpSetSamplingPeriodReq)
         req_payload.SamplingPeriod = samplingPeriod
-        return self.transaction_runner.run_transaction(
-            request, BoapAcpMsgId.BOAP_ACP_SET_SAMPLING_PERIOD_RESP
-        )
+        return request
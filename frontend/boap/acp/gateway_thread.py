@@ -2,30 +2,64 @@
 
 import logging
 import threading
-from queue import Queue
-from typing import List
+from typing import Dict, List
 
-from . import get_acp_stack_handle
-from .messages import BoapAcpMsg, BoapAcpMsgId, SBoapAcpLogCommit
+from .message_queue import MessageQueue
+from .messages import (
+    BoapAcpMsg,
+    BoapAcpMsgId,
+    BoapAcpNodeId,
+    SBoapAcpLogCommit,
+)
+from .stack import BoapAcp
+
+# Remote log line prefixes (the sender is validated by the stack)
+_SENDER_LABEL = {node: "[0x%02X]" % node for node in BoapAcpNodeId}
+
+# Plain integer IDs of the messages handled by the gateway itself
+_PING_REQ = int(BoapAcpMsgId.BOAP_ACP_PING_REQ)
+_LOG_COMMIT = int(BoapAcpMsgId.BOAP_ACP_LOG_COMMIT)
 
 
 class LocalRouting:
     """Message routing table entry."""
 
-    def __init__(self, queue: Queue, msg_ids: List[BoapAcpMsgId]) -> None:
+    def __init__(
+        self, queue: MessageQueue, msg_ids: List[BoapAcpMsgId]
+    ) -> None:
         """Initialize a routing table entry."""
         self.queue = queue
-        self.msg_ids = msg_ids
+        self.msg_ids = frozenset(msg_ids)
 
 
 class Gateway:
     """ACP gateway thread."""
 
-    def __init__(self, routing_table: List[LocalRouting]) -> None:
+    RECEIVE_BATCH_SIZE = 32
+
+    def __init__(
+        self, acp_stack: BoapAcp, routing_table: List[LocalRouting]
+    ) -> None:
         """Initialize and start an ACP gateway."""
         self.log = logging.getLogger("boap-gui-logger")
         self.remote_log = logging.getLogger("boap-remote-logger")
+        self.acp_stack = acp_stack
         self.routing_table = routing_table
+        # Flatten the routing table into a message ID to queue mapping
+        # keyed by plain integers, which received message IDs are
+        self.dispatch_table: Dict[int, MessageQueue] = {
+            int(msg_id): route.queue
+            for route in routing_table
+            for msg_id in route.msg_ids
+        }
+        # Ping responses carry no payload and are never mutated by the
+        # stack, so build one per possible sender and resend it every time
+        self.ping_responses: Dict[int, BoapAcpMsg] = {
+            int(node): acp_stack.msg_create(
+                node, BoapAcpMsgId.BOAP_ACP_PING_RESP
+            )
+            for node in BoapAcpNodeId
+        }
 
         self.log.debug("Starting the gateway thread...")
         # Create the gateway thread
@@ -40,35 +74,46 @@ class Gateway:
         """ACP gateway thread entry point."""
         self.log.debug("Gateway thread entered")
 
-        while True:
-            # Block on receive
-            message = get_acp_stack_handle().msg_receive()
+        # Bind the stack methods once for the lifetime of the thread
+        msg_receive_many = self.acp_stack.msg_receive_many
+        msg_send = self.acp_stack.msg_send
+        ping_responses = self.ping_responses
 
-            if message:
-                if BoapAcpMsgId.BOAP_ACP_PING_REQ == message.get_id():
+        while True:
+            # Block on receive and pick up any other buffered messages
+            for message in msg_receive_many(self.RECEIVE_BATCH_SIZE):
+                msg_id = message.get_id()
+                if _PING_REQ == msg_id:
                     # Respond to ping requests
-                    pingResponse = get_acp_stack_handle().msg_create(
-                        message.get_sender(), BoapAcpMsgId.BOAP_ACP_PING_RESP
-                    )
-                    get_acp_stack_handle().msg_send(pingResponse)
-                elif BoapAcpMsgId.BOAP_ACP_LOG_COMMIT == message.get_id():
+                    msg_send(ping_responses[message.get_sender()])
+                    message.release()
+                elif _LOG_COMMIT == msg_id:
                     payload = message.get_payload()
                     assert isinstance(payload, SBoapAcpLogCommit)
                     # Print log messages locally
                     self.remote_log.info(
-                        f"[0x{message.get_sender():02X}] " + payload.Message
+                        "%s %s",
+                        _SENDER_LABEL[message.get_sender()],
+                        payload.Message,
                     )
+                    message.release()
                 else:
                     # Forward remaining traffic to appropriate queues
                     self.__handle_application_message(message)
 
     def __handle_application_message(self, message: BoapAcpMsg) -> None:
         """Handle application message."""
-        for route in self.routing_table:
-            if message.get_id() in route.msg_ids:
-                route.queue.put(message)
-                return
+        msg_queue = self.dispatch_table.get(message.get_id())
+        if msg_queue is not None:
+            msg_queue.put(message)
+        else:
+            self.__warn_unrouted(message)
+
+    def __warn_unrouted(self, message: BoapAcpMsg) -> None:
+        """Report a message missing from the routing table."""
         self.log.warning(
-            f"Message ID 0x{message.get_id():02X} not found in the"
-            + f" routing table (sender: 0x{message.get_sender():02X})"
+            "Message ID 0x%02X not found in the routing table"
+            + " (sender: 0x%02X)",
+            message.get_id(),
+            message.get_sender(),
         )
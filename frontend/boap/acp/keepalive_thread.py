@@ -4,9 +4,11 @@ import logging
 import queue
 import threading
 import time
+from typing import Dict
 
-from . import get_acp_stack_handle
+from .message_queue import MessageQueue
 from .messages import BoapAcpMsg, BoapAcpMsgId, BoapAcpNodeId
+from .stack import BoapAcp
 
 
 class Keepalive:
@@ -15,12 +17,25 @@ class Keepalive:
     PING_PERIOD = 10
     RESPONSE_TIMEOUT = 1
 
-    def __init__(self) -> None:
+    def __init__(self, acp_stack: BoapAcp) -> None:
         """Initialize and start the keepalive thread."""
         self.log = logging.getLogger("boap-gui-logger")
+        self.acp_stack = acp_stack
 
         # Create the message queue
-        self.msg_queue: queue.Queue = queue.Queue()
+        self.msg_queue = MessageQueue()
+
+        # Ping requests carry no payload and are never mutated by the stack,
+        # so build them once and resend the same objects on every tick
+        self.ping_requests: Dict[BoapAcpNodeId, BoapAcpMsg] = {
+            node: self.acp_stack.msg_create(
+                node, BoapAcpMsgId.BOAP_ACP_PING_REQ
+            )
+            for node in (
+                BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
+                BoapAcpNodeId.BOAP_ACP_NODE_ID_CONTROLLER,
+            )
+        }
 
         self.log.debug("Starting the keepalive thread...")
         # Create the keepalive thread
@@ -31,7 +46,7 @@ class Keepalive:
         )
         self.keepalive_thread.start()
 
-    def get_message_queue(self) -> queue.Queue:
+    def get_message_queue(self) -> MessageQueue:
         """Get keepalive thread's message queue."""
         return self.msg_queue
 
@@ -42,30 +57,29 @@ class Keepalive:
         while True:
             time.sleep(self.PING_PERIOD)
 
-            # Ping the plant
-            self.__ping_and_wait_for_response(
-                BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT
-            )
-            # Ping the controller
-            self.__ping_and_wait_for_response(
-                BoapAcpNodeId.BOAP_ACP_NODE_ID_CONTROLLER
-            )
+            # Ping the plant and the controller at once...
+            for request in self.ping_requests.values():
+                self.acp_stack.msg_send(request)
+            # ...and wait for both responses
+            self.__collect_ping_responses()
 
-    def __ping_and_wait_for_response(self, node: BoapAcpNodeId) -> None:
-        """Ping a BOAP node and wait for response."""
-        request = get_acp_stack_handle().msg_create(
-            node, BoapAcpMsgId.BOAP_ACP_PING_REQ
-        )
-        get_acp_stack_handle().msg_send(request)
+    def __collect_ping_responses(self) -> None:
+        """Wait for responses from all pinged nodes."""
+        pending = set(self.ping_requests)
+        deadline = time.monotonic() + self.RESPONSE_TIMEOUT
         try:
-            response: BoapAcpMsg = self.msg_queue.get(
-                timeout=self.RESPONSE_TIMEOUT
-            )
-            # Assert message from the correct receiver
-            if response.get_sender() != node:
-                self.log.warning(
-                    f"Sent ping request to 0x{node:02X}."
-                    + f"0x{response.get_sender():02X} responded instead"
+            while pending:
+                response: BoapAcpMsg = self.msg_queue.get(
+                    timeout=max(deadline - time.monotonic(), 0)
                 )
+                sender = response.get_sender()
+                response.release()
+                if sender in pending:
+                    pending.remove(sender)
+                else:
+                    self.log.warning(
+                        "Unexpected ping response from 0x%02X", sender
+                    )
         except queue.Empty:
-            self.log.warning(f"Node 0x{node:02X} failed to respond to ping")
+            for node in pending:
+                self.log.warning("Node 0x%02X failed to respond to ping", node)
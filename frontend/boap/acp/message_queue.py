@@ -0,0 +1,82 @@
+"""Lightweight message queue."""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+
+class MessageQueue:
+    """Unbounded FIFO queue for handing messages over between threads.
+
+    A cheaper alternative to queue.Queue relying on the atomicity of deque
+    appends and pops, with a single event used to wake up the consumer.
+    Implements the subset of the queue.Queue interface used by the
+    application and raises queue.Empty on timeouts the same way. If maxlen
+    is given, the queue is bounded and putting an item into a full queue
+    discards the oldest one instead of blocking.
+    """
+
+    DROP_WARNING_PERIOD = 100
+
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        """Create an empty queue."""
+        self.log = logging.getLogger("boap-gui-logger")
+        self.items: Deque[Any] = deque(maxlen=maxlen)
+        self.item_available = threading.Event()
+        self.dropped = 0
+
+    def put(self, item: Any) -> None:
+        """Put an item in the queue."""
+        items = self.items
+        if len(items) == items.maxlen:
+            # The append below discards the oldest item
+            self.dropped += 1
+            if self.dropped % self.DROP_WARNING_PERIOD == 1:
+                self.log.warning(
+                    "Message queue full, %d items dropped so far", self.dropped
+                )
+        items.append(item)
+        self.item_available.set()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Remove and return an item from the queue."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.items.popleft()
+            except IndexError:
+                if not block:
+                    raise queue.Empty
+            # Rearm the event and recheck the queue so that an item put
+            # in the meantime is not missed
+            self.item_available.clear()
+            if self.items:
+                continue
+            remaining = (
+                None if deadline is None else deadline - time.monotonic()
+            )
+            if not self.item_available.wait(remaining):
+                raise queue.Empty
+
+    def get_nowait(self) -> Any:
+        """Remove and return an item if one is immediately available."""
+        return self.get(block=False)
+
+    def get_many(self, max_count: int, block: bool = True) -> List[Any]:
+        """Remove and return a batch of items from the queue.
+
+        Block until at least one item is available (or raise queue.Empty
+        right away if block is False), then return it along with any other
+        items already queued (up to max_count items in total).
+        """
+        items = [self.get(block)]
+        popleft = self.items.popleft
+        try:
+            while len(items) < max_count:
+                items.append(popleft())
+        except IndexError:
+            pass
+        return items
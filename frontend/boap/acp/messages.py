@@ -2,7 +2,7 @@
 
 import struct
 from enum import IntEnum, unique
-from typing import Any
+from typing import Any, ClassVar, Deque, Optional, Union
 
 from ..defs import (
     BoapAcpInvalidMsgSizeError,
@@ -12,6 +12,19 @@ from ..defs import (
     EBoapRet_Ok,
 )
 
+# Precompiled payload layouts
+_BALL_TRACE_LAYOUT = struct.Struct("<Qffff")
+_PID_SETTINGS_LAYOUT = struct.Struct("<Ifff")
+_PID_SETTINGS_CHANGE_LAYOUT = struct.Struct("<Iffffff")
+_U32_LAYOUT = struct.Struct("<I")
+_U32X2_LAYOUT = struct.Struct("<II")
+_U32X4_LAYOUT = struct.Struct("<IIII")
+_F32_LAYOUT = struct.Struct("<f")
+_F32X2_LAYOUT = struct.Struct("<ff")
+
+# Payloads are parsed either from bytes or in place from the receive buffer
+SerialPayload = Union[bytes, memoryview]
+
 
 @unique
 class BoapAcpNodeId(IntEnum):
@@ -50,13 +63,10 @@ class BoapAcpMsgId(IntEnum):
 class BoapAcpMsgPayload:
     """Generic ACP payload."""
 
-    def __init__(self, size: int) -> None:
-        """Initialize generic payload."""
-        self._size = size
+    __slots__ = ()
 
-    def size(self) -> int:
-        """Get payload size."""
-        return self._size
+    # Payload size in bytes, fixed for each payload type
+    SIZE: ClassVar[int] = 0
 
     def serialize(self) -> bytes:
         """Serialize an ACP payload."""
@@ -64,7 +74,7 @@ class BoapAcpMsgPayload:
             "Serialize method not implemented by subclass"
         )
 
-    def parse(self, serialized: bytes) -> Any:
+    def parse(self, serialized: SerialPayload) -> Any:
         """Deserialize an ACP payload."""
         raise NotImplementedError("Parse method not implemented by subclass")
 
@@ -72,26 +82,54 @@ class BoapAcpMsgPayload:
 class BoapAcpMsg:
     """ACP message."""
 
+    __slots__ = (
+        "msg_id",
+        "sender",
+        "receiver",
+        "payload",
+        "payload_size",
+        "pool",
+    )
+
     def __init__(
         self,
         msg_id: BoapAcpMsgId,
         sender: BoapAcpNodeId,
         receiver: BoapAcpNodeId,
-        serial_payload: bytes = None,
+        serial_payload: Optional[SerialPayload] = None,
+        pool: Optional[Deque["BoapAcpMsg"]] = None,
     ) -> None:
         """Create an ACP message."""
         self.msg_id = msg_id
-        self.sender = sender
-        self.receiver = receiver
+        self.pool = pool
         self.payload_size = 0
         self.payload = get_payload_by_id(self.msg_id)
         if self.payload:
-            if serial_payload:
-                try:
-                    self.payload.parse(serial_payload)
-                except struct.error:
-                    raise BoapAcpMalformedMessageError
-            self.payload_size = self.payload.size()
+            self.payload_size = self.payload.SIZE
+        self.reset(sender, receiver, serial_payload)
+
+    def reset(
+        self,
+        sender: BoapAcpNodeId,
+        receiver: BoapAcpNodeId,
+        serial_payload: Optional[SerialPayload] = None,
+    ) -> None:
+        """Reinitialize the message header and parse the payload if any."""
+        self.sender = sender
+        self.receiver = receiver
+        if self.payload and serial_payload:
+            try:
+                self.payload.parse(serial_payload)
+            except struct.error:
+                raise BoapAcpMalformedMessageError
+
+    def release(self) -> None:
+        """Return the message to the pool it was allocated from.
+
+        The message must not be accessed after it has been released.
+        """
+        if self.pool is not None:
+            self.pool.append(self)
 
     def get_id(self) -> BoapAcpMsgId:
         """Get ACP message ID."""
@@ -118,9 +156,17 @@ class BoapAcpMsg:
 class SBoapAcpBallTraceInd(BoapAcpMsgPayload):
     """Ball trace indicator message."""
 
+    __slots__ = (
+        "SampleNumber",
+        "SetpointX",
+        "PositionX",
+        "SetpointY",
+        "PositionY",
+    )
+    SIZE = _BALL_TRACE_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize a trace indicator message."""
-        super().__init__(24)
         self.SampleNumber = 0
         self.SetpointX = 0.0
         self.PositionX = 0.0
@@ -129,8 +175,7 @@ class SBoapAcpBallTraceInd(BoapAcpMsgPayload):
 
     def serialize(self) -> bytes:
         """Serialize a trace indicator message."""
-        return struct.pack(  # noqa: FKA01
-            "<Qffff",
+        return _BALL_TRACE_LAYOUT.pack(  # noqa: FKA01
             self.SampleNumber,
             self.SetpointX,
             self.PositionX,
@@ -138,7 +183,7 @@ class SBoapAcpBallTraceInd(BoapAcpMsgPayload):
             self.PositionY,
         )
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize a trace indicator message."""
         (
             self.SampleNumber,
@@ -146,73 +191,86 @@ class SBoapAcpBallTraceInd(BoapAcpMsgPayload):
             self.PositionX,
             self.SetpointY,
             self.PositionY,
-        ) = struct.unpack("<Qffff", serialized)
+        ) = _BALL_TRACE_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpBallTraceEnable(BoapAcpMsgPayload):
     """Ball tracing request."""
 
+    __slots__ = ("Enable",)
+    SIZE = _U32_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize a ball tracing request."""
-        super().__init__(4)
         self.Enable = EBoapBool_BoolTrue
 
     def serialize(self) -> bytes:
         """Serialize a ball tracing request."""
-        return struct.pack("<I", self.Enable)
+        return _U32_LAYOUT.pack(self.Enable)
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize a ball tracing request."""
-        (self.Enable,) = struct.unpack("<I", serialized)
+        (self.Enable,) = _U32_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpNewSetpointReq(BoapAcpMsgPayload):
     """New setpoint request."""
 
+    __slots__ = ("SetpointX", "SetpointY")
+    SIZE = _F32X2_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize a new setpoint request."""
-        super().__init__(8)
         self.SetpointX = 0.0
         self.SetpointY = 0.0
 
     def serialize(self) -> bytes:
         """Serialize a new setpoint request."""
-        return struct.pack(  # noqa: FKA01
-            "<ff", self.SetpointX, self.SetpointY
+        return _F32X2_LAYOUT.pack(  # noqa: FKA01
+            self.SetpointX, self.SetpointY
         )
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize a new setpoint request."""
-        self.SetpointX, self.SetpointY = struct.unpack("<ff", serialized)
+        self.SetpointX, self.SetpointY = _F32X2_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpGetPidSettingsReq(BoapAcpMsgPayload):
     """Fetch PID settings request."""
 
+    __slots__ = ("AxisId",)
+    SIZE = _U32_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize fetch PID settings request."""
-        super().__init__(4)
         self.AxisId = EBoapAxis_X
 
     def serialize(self) -> bytes:
         """Serialize fetch PID settings request."""
-        return struct.pack("<I", self.AxisId)
+        return _U32_LAYOUT.pack(self.AxisId)
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize fetch PID settings request."""
-        (self.AxisId,) = struct.unpack("<I", serialized)
+        (self.AxisId,) = _U32_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpGetPidSettingsResp(BoapAcpMsgPayload):
     """Fetch PID settings response."""
 
+    __slots__ = (
+        "AxisId",
+        "ProportionalGain",
+        "IntegralGain",
+        "DerivativeGain",
+    )
+    SIZE = _PID_SETTINGS_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize fetch PID settings response."""
-        super().__init__(16)
         self.AxisId = EBoapAxis_X
         self.ProportionalGain = 0.0
         self.IntegralGain = 0.0
@@ -220,31 +278,37 @@ class SBoapAcpGetPidSettingsResp(BoapAcpMsgPayload):
 
     def serialize(self) -> bytes:
         """Serialize fetch PID settings response."""
-        return struct.pack(  # noqa: FKA01
-            "<Ifff",
+        return _PID_SETTINGS_LAYOUT.pack(  # noqa: FKA01
             self.AxisId,
             self.ProportionalGain,
             self.IntegralGain,
             self.DerivativeGain,
         )
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize fetch PID settings response."""
         (
             self.AxisId,
             self.ProportionalGain,
             self.IntegralGain,
             self.DerivativeGain,
-        ) = struct.unpack("<Ifff", serialized)
+        ) = _PID_SETTINGS_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpSetPidSettingsReq(BoapAcpMsgPayload):
     """New PID settings request."""
 
+    __slots__ = (
+        "AxisId",
+        "ProportionalGain",
+        "IntegralGain",
+        "DerivativeGain",
+    )
+    SIZE = _PID_SETTINGS_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize new PID settings request."""
-        super().__init__(16)
         self.AxisId = EBoapAxis_X
         self.ProportionalGain = 0.0
         self.IntegralGain = 0.0
@@ -252,31 +316,40 @@ class SBoapAcpSetPidSettingsReq(BoapAcpMsgPayload):
 
     def serialize(self) -> bytes:
         """Serialize new PID settings request."""
-        return struct.pack(  # noqa: FKA01
-            "<Ifff",
+        return _PID_SETTINGS_LAYOUT.pack(  # noqa: FKA01
             self.AxisId,
             self.ProportionalGain,
             self.IntegralGain,
             self.DerivativeGain,
         )
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize new PID settings request."""
         (
             self.AxisId,
             self.ProportionalGain,
             self.IntegralGain,
             self.DerivativeGain,
-        ) = struct.unpack("<Ifff", serialized)
+        ) = _PID_SETTINGS_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpSetPidSettingsResp(BoapAcpMsgPayload):
     """New PID settings response."""
 
+    __slots__ = (
+        "AxisId",
+        "OldProportionalGain",
+        "OldIntegralGain",
+        "OldDerivativeGain",
+        "NewProportionalGain",
+        "NewIntegralGain",
+        "NewDerivativeGain",
+    )
+    SIZE = _PID_SETTINGS_CHANGE_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize new PID settings response."""
-        super().__init__(28)
         self.AxisId = EBoapAxis_X
         self.OldProportionalGain = 0.0
         self.OldIntegralGain = 0.0
@@ -287,8 +360,7 @@ class SBoapAcpSetPidSettingsResp(BoapAcpMsgPayload):
 
     def serialize(self) -> bytes:
         """Serialize new PID settings response."""
-        return struct.pack(  # noqa: FKA01
-            "<Iffffff",
+        return _PID_SETTINGS_CHANGE_LAYOUT.pack(  # noqa: FKA01
             self.AxisId,
             self.OldProportionalGain,
             self.OldIntegralGain,
@@ -298,7 +370,7 @@ class SBoapAcpSetPidSettingsResp(BoapAcpMsgPayload):
             self.NewDerivativeGain,
         )
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize new PID settings response."""
         (
             self.AxisId,
@@ -308,65 +380,71 @@ class SBoapAcpSetPidSettingsResp(BoapAcpMsgPayload):
             self.NewProportionalGain,
             self.NewIntegralGain,
             self.NewDerivativeGain,
-        ) = struct.unpack("<Iffffff", serialized)
+        ) = _PID_SETTINGS_CHANGE_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpGetSamplingPeriodResp(BoapAcpMsgPayload):
     """Fetch sampling period response."""
 
+    __slots__ = ("SamplingPeriod",)
+    SIZE = _F32_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize fetch sampling period response."""
-        super().__init__(4)
         self.SamplingPeriod = 0.0
 
     def serialize(self) -> bytes:
         """Serialize fetch sampling period response."""
-        return struct.pack("<f", self.SamplingPeriod)
+        return _F32_LAYOUT.pack(self.SamplingPeriod)
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize fetch sampling period response."""
-        (self.SamplingPeriod,) = struct.unpack("<f", serialized)
+        (self.SamplingPeriod,) = _F32_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpSetSamplingPeriodReq(BoapAcpMsgPayload):
     """New sampling period request."""
 
+    __slots__ = ("SamplingPeriod",)
+    SIZE = _F32_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize new sampling period request."""
-        super().__init__(4)
         self.SamplingPeriod = 0.0
 
     def serialize(self) -> bytes:
         """Serialize new sampling period request."""
-        return struct.pack("<f", self.SamplingPeriod)
+        return _F32_LAYOUT.pack(self.SamplingPeriod)
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize new sampling period request."""
-        (self.SamplingPeriod,) = struct.unpack("<f", serialized)
+        (self.SamplingPeriod,) = _F32_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpSetSamplingPeriodResp(BoapAcpMsgPayload):
     """New sampling period response."""
 
+    __slots__ = ("OldSamplingPeriod", "NewSamplingPeriod")
+    SIZE = _F32X2_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize new sampling period response."""
-        super().__init__(8)
         self.OldSamplingPeriod = 0.0
         self.NewSamplingPeriod = 0.0
 
     def serialize(self) -> bytes:
         """Serialize new sampling period response."""
-        return struct.pack(  # noqa: FKA01
-            "<ff", self.OldSamplingPeriod, self.NewSamplingPeriod
+        return _F32X2_LAYOUT.pack(  # noqa: FKA01
+            self.OldSamplingPeriod, self.NewSamplingPeriod
         )
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize new sampling period response."""
-        self.OldSamplingPeriod, self.NewSamplingPeriod = struct.unpack(
-            "<ff", serialized
+        self.OldSamplingPeriod, self.NewSamplingPeriod = _F32X2_LAYOUT.unpack(
+            serialized
         )
         return self
 
@@ -374,65 +452,73 @@ class SBoapAcpSetSamplingPeriodResp(BoapAcpMsgPayload):
 class SBoapAcpGetFilterOrderReq(BoapAcpMsgPayload):
     """Fetch filter order request."""
 
+    __slots__ = ("AxisId",)
+    SIZE = _U32_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize fetch filter order request."""
-        super().__init__(4)
         self.AxisId = EBoapAxis_X
 
     def serialize(self) -> bytes:
         """Serialize fetch filter order request."""
-        return struct.pack("<I", self.AxisId)
+        return _U32_LAYOUT.pack(self.AxisId)
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize fetch filter order request."""
-        (self.AxisId,) = struct.unpack("<I", serialized)
+        (self.AxisId,) = _U32_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpGetFilterOrderResp(BoapAcpMsgPayload):
     """Fetch filter order response."""
 
+    __slots__ = ("AxisId", "FilterOrder")
+    SIZE = _U32X2_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize fetch filter order response."""
-        super().__init__(8)
         self.AxisId = EBoapAxis_X
         self.FilterOrder = 0
 
     def serialize(self) -> bytes:
         """Serialize fetch filter order response."""
-        return struct.pack("<II", self.AxisId, self.FilterOrder)  # noqa: FKA01
+        return _U32X2_LAYOUT.pack(self.AxisId, self.FilterOrder)  # noqa: FKA01
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize fetch filter order response."""
-        self.AxisId, self.FilterOrder = struct.unpack("<II", serialized)
+        self.AxisId, self.FilterOrder = _U32X2_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpSetFilterOrderReq(BoapAcpMsgPayload):
     """New filter order request."""
 
+    __slots__ = ("AxisId", "FilterOrder")
+    SIZE = _U32X2_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize new filter order request."""
-        super().__init__(8)
         self.AxisId = EBoapAxis_X
         self.FilterOrder = 0
 
     def serialize(self) -> bytes:
         """Serialize new filter order request."""
-        return struct.pack("<II", self.AxisId, self.FilterOrder)  # noqa: FKA01
+        return _U32X2_LAYOUT.pack(self.AxisId, self.FilterOrder)  # noqa: FKA01
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize new filter order request."""
-        self.AxisId, self.FilterOrder = struct.unpack("<II", serialized)
+        self.AxisId, self.FilterOrder = _U32X2_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpSetFilterOrderResp(BoapAcpMsgPayload):
     """New filter order response."""
 
+    __slots__ = ("Status", "AxisId", "OldFilterOrder", "NewFilterOrder")
+    SIZE = _U32X4_LAYOUT.size
+
     def __init__(self) -> None:
         """Initialize new filter order response."""
-        super().__init__(16)
         self.Status = EBoapRet_Ok
         self.AxisId = EBoapAxis_X
         self.OldFilterOrder = 0
@@ -440,95 +526,104 @@ class SBoapAcpSetFilterOrderResp(BoapAcpMsgPayload):
 
     def serialize(self) -> bytes:
         """Serialize new filter order response."""
-        return struct.pack(  # noqa: FKA01
-            "<IIII",
+        return _U32X4_LAYOUT.pack(  # noqa: FKA01
             self.Status,
             self.AxisId,
             self.OldFilterOrder,
             self.NewFilterOrder,
         )
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize new filter order response."""
         (
             self.Status,
             self.AxisId,
             self.OldFilterOrder,
             self.NewFilterOrder,
-        ) = struct.unpack("<IIII", serialized)
+        ) = _U32X4_LAYOUT.unpack(serialized)
         return self
 
 
 class SBoapAcpLogCommit(BoapAcpMsgPayload):
     """Log message."""
 
+    __slots__ = ("Message",)
+    SIZE = 200
+
     def __init__(self) -> None:
         """Initialize a log message."""
-        super().__init__(200)
         self.Message = ""
 
     def serialize(self) -> bytes:
         """Serialize a log message."""
         # Assert no overflow and enough space for the null character
-        if len(self.Message) >= self.size():
+        if len(self.Message) >= self.SIZE:
             raise BoapAcpInvalidMsgSizeError(
                 f"Invalid payload size: {len(self.Message)}."
-                + f" Max SBoapAcpLogCommit payload size set to {self.size()}"
+                + f" Max SBoapAcpLogCommit payload size set to {self.SIZE}"
             )
         # Serialize the string and append trailing null
         # characters to fill the buffer
-        return bytearray(self.Message, "ascii") + bytearray(
-            "".join(["\0" for _ in range(self.size() - len(self.Message))]),
-            "ascii",
-        )
+        return self.Message.encode("ascii").ljust(self.SIZE, b"\0")
 
-    def parse(self, serialized: bytes) -> BoapAcpMsgPayload:
+    def parse(self, serialized: SerialPayload) -> BoapAcpMsgPayload:
         """Deserialize a log message."""
+        # Copy the text out, as the payload may be a view of a shared buffer
+        message = bytes(serialized)
         # Find the null terminator
-        null_pos = serialized.find(bytes("\0", "ascii"))
+        null_pos = message.find(b"\0")
         # Strip the trailing newline
-        self.Message = serialized[:null_pos].decode("ascii").strip("\n")
+        self.Message = message[:null_pos].decode("ascii").strip("\n")
         return self
 
 
+# Payload structures of the ACP messages
+# fmt: off
+_PAYLOAD_TYPES = {
+    BoapAcpMsgId.BOAP_ACP_PING_REQ: None,
+    BoapAcpMsgId.BOAP_ACP_PING_RESP: None,
+    BoapAcpMsgId.BOAP_ACP_BALL_TRACE_IND:
+        SBoapAcpBallTraceInd,
+    BoapAcpMsgId.BOAP_ACP_BALL_TRACE_ENABLE:
+        SBoapAcpBallTraceEnable,
+    BoapAcpMsgId.BOAP_ACP_NEW_SETPOINT_REQ:
+        SBoapAcpNewSetpointReq,
+    BoapAcpMsgId.BOAP_ACP_GET_PID_SETTINGS_REQ:
+        SBoapAcpGetPidSettingsReq,
+    BoapAcpMsgId.BOAP_ACP_GET_PID_SETTINGS_RESP:
+        SBoapAcpGetPidSettingsResp,
+    BoapAcpMsgId.BOAP_ACP_SET_PID_SETTINGS_REQ:
+        SBoapAcpSetPidSettingsReq,
+    BoapAcpMsgId.BOAP_ACP_SET_PID_SETTINGS_RESP:
+        SBoapAcpSetPidSettingsResp,
+    BoapAcpMsgId.BOAP_ACP_GET_SAMPLING_PERIOD_REQ: None,
+    BoapAcpMsgId.BOAP_ACP_GET_SAMPLING_PERIOD_RESP:
+        SBoapAcpGetSamplingPeriodResp,
+    BoapAcpMsgId.BOAP_ACP_SET_SAMPLING_PERIOD_REQ:
+        SBoapAcpSetSamplingPeriodReq,
+    BoapAcpMsgId.BOAP_ACP_SET_SAMPLING_PERIOD_RESP:
+        SBoapAcpSetSamplingPeriodResp,
+    BoapAcpMsgId.BOAP_ACP_GET_FILTER_ORDER_REQ:
+        SBoapAcpGetFilterOrderReq,
+    BoapAcpMsgId.BOAP_ACP_GET_FILTER_ORDER_RESP:
+        SBoapAcpGetFilterOrderResp,
+    BoapAcpMsgId.BOAP_ACP_SET_FILTER_ORDER_REQ:
+        SBoapAcpSetFilterOrderReq,
+    BoapAcpMsgId.BOAP_ACP_SET_FILTER_ORDER_RESP:
+        SBoapAcpSetFilterOrderResp,
+    BoapAcpMsgId.BOAP_ACP_LOG_COMMIT:
+        SBoapAcpLogCommit,
+}
+# fmt: on
+
+# Payload structures indexed directly by the raw message ID
+_PAYLOAD_TYPE_TABLE = tuple(
+    _PAYLOAD_TYPES[BoapAcpMsgId(msg_id)]
+    for msg_id in range(max(BoapAcpMsgId) + 1)
+)
+
+
 def get_payload_by_id(msg_id: BoapAcpMsgId) -> Any:
     """Find ACP message payload structure by message ID."""
-    # fmt: off
-    mapping = {
-        BoapAcpMsgId.BOAP_ACP_PING_REQ: None,
-        BoapAcpMsgId.BOAP_ACP_PING_RESP: None,
-        BoapAcpMsgId.BOAP_ACP_BALL_TRACE_IND:
-            SBoapAcpBallTraceInd,
-        BoapAcpMsgId.BOAP_ACP_BALL_TRACE_ENABLE:
-            SBoapAcpBallTraceEnable,
-        BoapAcpMsgId.BOAP_ACP_NEW_SETPOINT_REQ:
-            SBoapAcpNewSetpointReq,
-        BoapAcpMsgId.BOAP_ACP_GET_PID_SETTINGS_REQ:
-            SBoapAcpGetPidSettingsReq,
-        BoapAcpMsgId.BOAP_ACP_GET_PID_SETTINGS_RESP:
-            SBoapAcpGetPidSettingsResp,
-        BoapAcpMsgId.BOAP_ACP_SET_PID_SETTINGS_REQ:
-            SBoapAcpSetPidSettingsReq,
-        BoapAcpMsgId.BOAP_ACP_SET_PID_SETTINGS_RESP:
-            SBoapAcpSetPidSettingsResp,
-        BoapAcpMsgId.BOAP_ACP_GET_SAMPLING_PERIOD_REQ: None,
-        BoapAcpMsgId.BOAP_ACP_GET_SAMPLING_PERIOD_RESP:
-            SBoapAcpGetSamplingPeriodResp,
-        BoapAcpMsgId.BOAP_ACP_SET_SAMPLING_PERIOD_REQ:
-            SBoapAcpSetSamplingPeriodReq,
-        BoapAcpMsgId.BOAP_ACP_SET_SAMPLING_PERIOD_RESP:
-            SBoapAcpSetSamplingPeriodResp,
-        BoapAcpMsgId.BOAP_ACP_GET_FILTER_ORDER_REQ:
-            SBoapAcpGetFilterOrderReq,
-        BoapAcpMsgId.BOAP_ACP_GET_FILTER_ORDER_RESP:
-            SBoapAcpGetFilterOrderResp,
-        BoapAcpMsgId.BOAP_ACP_SET_FILTER_ORDER_REQ:
-            SBoapAcpSetFilterOrderReq,
-        BoapAcpMsgId.BOAP_ACP_SET_FILTER_ORDER_RESP:
-            SBoapAcpSetFilterOrderResp,
-        BoapAcpMsgId.BOAP_ACP_LOG_COMMIT:
-            SBoapAcpLogCommit,
-    }
-    # fmt: on
-    factory = mapping[msg_id]
+    factory = _PAYLOAD_TYPE_TABLE[msg_id]
     return factory() if factory else None
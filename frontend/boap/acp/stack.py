@@ -1,20 +1,50 @@
 """Singleton ACP stack."""
 
 import logging
+import struct
 import threading
-from typing import Any
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 import serial
 
 from ..defs import BoapAcpMalformedMessageError
-from .messages import BoapAcpMsg, BoapAcpMsgId, BoapAcpNodeId
+from .messages import (
+    BoapAcpMsg,
+    BoapAcpMsgId,
+    BoapAcpNodeId,
+    SerialPayload,
+    get_payload_by_id,
+)
+
+# Header layout: message ID, sender, receiver and payload size
+_HEADER_LAYOUT = struct.Struct("<BBBB")
+_RECEIVER_OFFSET = 2
+
+# Header field values accepted by the stack
+_VALID_NODE_IDS = frozenset(int(node) for node in BoapAcpNodeId)
+_PC_NODE_ID = int(BoapAcpNodeId.BOAP_ACP_NODE_ID_PC)
+
+
+def _get_payload_size(msg_id: BoapAcpMsgId) -> int:
+    """Get the payload size of a message as sent by the firmware."""
+    payload = get_payload_by_id(msg_id)
+    return payload.SIZE if payload else 0
+
+
+# Payload sizes of valid messages (the firmware always sends full payloads)
+_PAYLOAD_SIZES = {
+    int(msg_id): _get_payload_size(msg_id) for msg_id in BoapAcpMsgId
+}
 
 
 class BoapAcp:
     """ACP stack."""
 
     HEADER_SIZE = 4
-    PAYLOAD_RECV_TO = 1
+    FRAME_RECV_TO = 1
+    MSG_POOL_SIZE = 32
+    OS_RX_BUFFER_SIZE = 65536
 
     def __init__(self, port: Any, baud: int) -> None:
         """Initialize the ACP stack."""
@@ -22,101 +52,186 @@ class BoapAcp:
         self.port = port
         self.baud = baud
         self.write_lock = threading.Lock()
+        # Bytes already read from the port, but not yet consumed
+        self.rx_buffer = bytearray()
+        # Set while skipping input in search of a valid header
+        self.resyncing = False
+        # Released messages available for reuse, per message ID (keyed by
+        # plain integers, as received IDs are raw header bytes)
+        self.msg_pools: Dict[int, Deque[BoapAcpMsg]] = {
+            int(msg_id): deque(maxlen=self.MSG_POOL_SIZE)
+            for msg_id in BoapAcpMsgId
+        }
 
         # Open the serial port
         self.log.info("Opening the serial port...")
-        self.serial = serial.Serial(port=self.port, baudrate=self.baud)
+        self.serial = serial.Serial(
+            port=self.port, baudrate=self.baud, timeout=self.FRAME_RECV_TO
+        )
+        # Enlarge the driver's receive buffer so that traces are not lost
+        # while the gateway thread is descheduled (only supported on Windows,
+        # Linux drivers buffer enough on their own)
+        if hasattr(self.serial, "set_buffer_size"):
+            self.serial.set_buffer_size(rx_size=self.OS_RX_BUFFER_SIZE)
 
     def msg_create(
         self, receiver: BoapAcpNodeId, msg_id: BoapAcpMsgId
     ) -> BoapAcpMsg:
-        """Create an ACP message."""
-        return BoapAcpMsg(
-            msg_id=msg_id,
-            sender=BoapAcpNodeId.BOAP_ACP_NODE_ID_PC,
-            receiver=receiver,
+        """Create an ACP message.
+
+        The message may be recycled from the pool, in which case its
+        payload holds stale values and must be filled in by the caller.
+        """
+        return self.__msg_alloc(
+            msg_id, BoapAcpNodeId.BOAP_ACP_NODE_ID_PC, receiver
         )
 
     def msg_send(self, msg: BoapAcpMsg) -> None:
         """Send an ACP message."""
-        serial_message = bytearray(
-            [
-                msg.get_id(),
-                msg.get_sender(),
-                msg.get_receiver(),
-                msg.get_payload_size(),
-            ]
+        serial_message = _HEADER_LAYOUT.pack(  # noqa: FKA01
+            msg.get_id(),
+            msg.get_sender(),
+            msg.get_receiver(),
+            msg.get_payload_size(),
         )
         if msg.payload:
-            serial_message += bytearray(msg.payload.serialize())
+            serial_message += msg.payload.serialize()
         # Call serial API
         with self.write_lock:
             self.serial.write(serial_message)
 
     def msg_receive(self) -> BoapAcpMsg:
         """Receive an ACP message."""
-        # Block on read (no timeout)
-        msg = None
-        while not msg:
-            # Read from the serial port
-            header = self.serial.read(self.HEADER_SIZE)
-
-            # Validate the header
-            if not self.__valid_header(header):
-                # Flush the OS buffer...
-                self.serial.read_all()
-                # ...and try again
+        return self.msg_receive_many(1)[0]
+
+    def msg_receive_many(self, max_count: int) -> List[BoapAcpMsg]:
+        """Receive a batch of ACP messages.
+
+        Block until at least one message is received, then return it along
+        with any other complete messages already buffered (up to max_count
+        messages in total).
+        """
+        messages: List[BoapAcpMsg] = []
+        # The buffer is only ever modified in place, so bind it once
+        rx_buffer = self.rx_buffer
+        serial_port = self.serial
+        while True:
+            missing = self.__parse_buffered(messages, max_count)
+            if messages:
+                return messages
+
+            # Block until the next frame is complete, fetching everything
+            # else the OS has buffered in the same read
+            partial_frame = len(rx_buffer) > 0
+            received = serial_port.read(max(serial_port.in_waiting, missing))
+            rx_buffer += received
+            if partial_frame and len(received) < missing:
+                # Read timed out in the middle of a frame
+                self.log.warning(
+                    "Failed to receive the frame in time"
+                    + f" (received: {bytes(rx_buffer).hex()})"
+                )
+                rx_buffer.clear()
+
+    def __parse_buffered(
+        self, messages: List[BoapAcpMsg], max_count: int
+    ) -> int:
+        """Parse complete frames from the receive buffer.
+
+        Return the number of bytes missing to complete the next frame.
+        """
+        rx_buffer = self.rx_buffer
+        header_size = self.HEADER_SIZE
+        unpack_header = _HEADER_LAYOUT.unpack_from
+        while len(messages) < max_count:
+            available = len(rx_buffer)
+            if available < header_size:
+                return header_size - available
+
+            # Parse and validate the header
+            msg_id, sender, receiver, payload_size = unpack_header(rx_buffer)
+            if not self.__valid_header(msg_id, sender, receiver, payload_size):
+                self.__resynchronize()
                 continue
 
-            # Parse the header
-            msg_id, sender, receiver, payload_size = header
-
-            payload = None
-            if payload_size:
-                # Received the payload if any declared in the header
-                timed_out = False
-
-                def timer_callback() -> None:
-                    nonlocal timed_out
-                    timed_out = True
-                    self.serial.cancel_read()
-
-                # Start a timer to not block waiting for payload indefinitely
-                timer = threading.Timer(self.PAYLOAD_RECV_TO, timer_callback)
-                timer.start()
-                payload = self.serial.read(payload_size)
-                timer.cancel()
-                if timed_out:
-                    self.log.warning(
-                        "Failed to receive the payload in time"
-                        + f" (header: id=0x{msg_id:02X},"
-                        + f" sender=0x{sender:02X}, "
-                        + f" receiver=0x{receiver:02X},"
-                        + f" payload_size={payload_size})"
-                    )
-                    continue
+            frame_size = header_size + payload_size
+            if available < frame_size:
+                # Wait for the rest of the frame
+                return frame_size - available
 
             try:
-                msg = BoapAcpMsg(
-                    msg_id=msg_id,
-                    sender=sender,
-                    receiver=receiver,
-                    serial_payload=payload,
-                )
+                # Parse the payload in place, releasing the views before
+                # the buffer gets resized
+                with memoryview(rx_buffer) as buffer_view:
+                    with buffer_view[header_size:frame_size] as payload:
+                        message = self.__msg_alloc(
+                            msg_id, sender, receiver, payload
+                        )
             except BoapAcpMalformedMessageError:
                 self.log.error(
                     "Failed to parse the payload of message"
                     + f" 0x{msg_id:02X} from 0x{sender:02X}"
                 )
-                # Flush the OS buffer
-                self.serial.read_all()
+                self.__resynchronize()
+                continue
+            del rx_buffer[:frame_size]
+            messages.append(message)
+            self.resyncing = False
+
+        return 0
+
+    def __msg_alloc(
+        self,
+        msg_id: BoapAcpMsgId,
+        sender: BoapAcpNodeId,
+        receiver: BoapAcpNodeId,
+        serial_payload: Optional[SerialPayload] = None,
+    ) -> BoapAcpMsg:
+        """Allocate a message, reusing a released one if available."""
+        pool = self.msg_pools[msg_id]
+        try:
+            msg = pool.pop()
+        except IndexError:
+            return BoapAcpMsg(
+                msg_id=msg_id,
+                sender=sender,
+                receiver=receiver,
+                serial_payload=serial_payload,
+                pool=pool,
+            )
+        try:
+            msg.reset(sender, receiver, serial_payload)
+        except BoapAcpMalformedMessageError:
+            # Keep the message for reuse
+            pool.append(msg)
+            raise
         return msg
 
-    def __valid_header(self, header: bytes) -> bool:
+    def __resynchronize(self) -> None:
+        """Drop the buffered bytes preceding the next possible frame.
+
+        Unlike flushing all input, this keeps any valid frames that follow.
+        All frames received are addressed to the PC, so the next candidate
+        header is found by searching for the PC node ID as the receiver.
+        """
+        if not self.resyncing:
+            self.log.warning("Invalid frame received, resynchronizing...")
+            self.resyncing = True
+        rx_buffer = self.rx_buffer
+        receiver_pos = rx_buffer.find(_PC_NODE_ID, _RECEIVER_OFFSET + 1)
+        if receiver_pos < 0:
+            # Only keep the bytes that may start a header not yet complete
+            start = max(len(rx_buffer) - _RECEIVER_OFFSET, 1)
+        else:
+            start = receiver_pos - _RECEIVER_OFFSET
+        del rx_buffer[:start]
+
+    def __valid_header(
+        self, msg_id: int, sender: int, receiver: int, payload_size: int
+    ) -> bool:
         """Validate an ACP header."""
-        msg_id, sender, receiver, _ = header
         return (
-            receiver == BoapAcpNodeId.BOAP_ACP_NODE_ID_PC
-            and sender in list(BoapAcpNodeId)
-            and msg_id in list(BoapAcpMsgId)
+            receiver == _PC_NODE_ID
+            and sender in _VALID_NODE_IDS
+            and _PAYLOAD_SIZES.get(msg_id) == payload_size
         )
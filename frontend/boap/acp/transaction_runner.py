@@ -1,41 +1,107 @@
 """Transaction running utility."""
 
+import logging
 import queue
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 from ..defs import BoapAcpTransactionError
-from . import get_acp_stack_handle
-from .messages import BoapAcpMsg, BoapAcpMsgId, BoapAcpMsgPayload
+from .message_queue import MessageQueue
+from .messages import BoapAcpMsg, BoapAcpMsgId
+from .stack import BoapAcp
+
+# Responses to pipelined requests are matched on the message ID and, for
+# per-axis messages, on the axis ID carried in the payload
+ResponseKey = Tuple[BoapAcpMsgId, Optional[int]]
 
 
 class TransactionRunner:
     """Transaction running utility."""
 
-    def __init__(self, msg_queue: queue.Queue, receive_timeout: float) -> None:
+    def __init__(
+        self,
+        acp_stack: BoapAcp,
+        msg_queue: MessageQueue,
+        receive_timeout: float,
+    ) -> None:
         """Instantiate a transaction runner."""
+        self.log = logging.getLogger("boap-gui-logger")
+        self.acp_stack = acp_stack
         self.msg_queue = msg_queue
         self.receive_timeout = receive_timeout
 
-    def run_transaction(
-        self, request: BoapAcpMsg, expected_response_id: BoapAcpMsgId
-    ) -> BoapAcpMsgPayload:
-        """Run an ACP transaction."""
-        # Send the request message
-        get_acp_stack_handle().msg_send(request)
-        # Wait for the response
-        try:
-            response: BoapAcpMsg = self.msg_queue.get(
-                timeout=self.receive_timeout
+    def run_transactions(
+        self,
+        transactions: List[
+            Tuple[BoapAcpMsg, ResponseKey, Callable[..., None]]
+        ],
+    ) -> None:
+        """Run a batch of pipelined ACP transactions.
+
+        All requests are sent up front and each response payload is passed
+        to the handler registered under the response's message ID and axis
+        ID (None for messages not bound to an axis) as soon as it arrives.
+        Responses are awaited until all of them have arrived or the receive
+        timeout has elapsed for the batch as a whole. BoapAcpTransactionError
+        is only raised after all the responses received in time have been
+        handled.
+        """
+        if not transactions:
+            return
+        self.__discard_stale_responses()
+        # Send all request messages
+        pending: Dict[ResponseKey, Tuple[int, Callable[..., None]]] = {}
+        msg_send = self.acp_stack.msg_send
+        for request, response_key, resp_handler in transactions:
+            pending[response_key] = (request.get_id(), resp_handler)
+            msg_send(request)
+        self.log.debug(
+            "Sent %d pipelined requests, awaiting the responses...",
+            len(transactions),
+        )
+        # Collect the responses against a single deadline
+        deadline = time.monotonic() + self.receive_timeout
+        while pending:
+            try:
+                response: BoapAcpMsg = self.msg_queue.get(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except queue.Empty:
+                break
+            resp_payload = response.get_payload()
+            entry = pending.pop(
+                (response.get_id(), getattr(resp_payload, "AxisId", None)),
+                None,
             )
-            if expected_response_id != response.get_id():
-                raise BoapAcpTransactionError(
-                    "ACP transaction failed. Expected response"
-                    + f" 0x{expected_response_id:02X},"
-                    + f" instead received 0x{response.get_id():02X}"
+            if entry is None:
+                self.log.warning(
+                    "Discarding unexpected response 0x%02X",
+                    response.get_id(),
                 )
-            return response.get_payload()
-        except queue.Empty:
+            else:
+                entry[1](resp_payload)
+            response.release()
+
+        if pending:
             raise BoapAcpTransactionError(
-                "ACP transaction failed. No response received"
-                + f" for message 0x{request.get_id():02X}"
-                + f" (expected response: 0x{expected_response_id:02X})"
+                "ACP transaction failed. No response received for: "
+                + ", ".join(
+                    f"message 0x{request_id:02X}"
+                    + f" (expected response: 0x{response_id:02X}"
+                    + ("" if axis is None else f", axis: {axis}")
+                    + ")"
+                    for (response_id, axis), (request_id, _) in pending.items()
+                )
+            )
+
+    def __discard_stale_responses(self) -> None:
+        """Drop responses left over from earlier transactions."""
+        while True:
+            try:
+                stale: BoapAcpMsg = self.msg_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.log.warning(
+                "Discarding stale response 0x%02X", stale.get_id()
             )
+            stale.release()
@@ -28,6 +28,14 @@ class PlantSettings:
         self.XAxis = self.AxisSettings()
         self.YAxis = self.AxisSettings()
 
+    def clone(self) -> "PlantSettings":
+        """Create a copy of the plant settings."""
+        clone = PlantSettings()
+        clone.SamplingPeriod = self.SamplingPeriod
+        clone.XAxis = self.XAxis.clone()
+        clone.YAxis = self.YAxis.clone()
+        return clone
+
     class AxisSettings:
         """Per-axis settings."""
 
@@ -38,6 +46,15 @@ class PlantSettings:
             self.DerivativeGain = 0.0
             self.FilterOrder = 5
 
+        def clone(self) -> "PlantSettings.AxisSettings":
+            """Create a copy of the per-axis settings."""
+            clone = PlantSettings.AxisSettings()
+            clone.ProportionalGain = self.ProportionalGain
+            clone.IntegralGain = self.IntegralGain
+            clone.DerivativeGain = self.DerivativeGain
+            clone.FilterOrder = self.FilterOrder
+            return clone
+
 
 # C-compatible integer representation of boolean values
 EBoapBool = int
@@ -1,10 +1,11 @@
 """BOAP GUI application."""
 
 import logging
-from queue import Queue
 
 from PyQt6 import QtWidgets
 
+from ..acp.message_queue import MessageQueue
+from ..acp.stack import BoapAcp
 from .control_panel import ControlPanel
 from .log_panel import LogPanel
 from .trace_panel import TracePanel
@@ -51,24 +52,28 @@ class BoapGui:
         self.vertical_layout.setStretchFactor(self.top_frame, 2)
         self.vertical_layout.setStretchFactor(self.log_panel.display, 1)
 
+    def attach_acp_stack(self, acp_stack: BoapAcp) -> None:
+        """Attach the ACP stack to the GUI components."""
+        self.control_panel.attach_acp_stack(acp_stack)
+
     def run(self) -> int:
         """Run the GUI application."""
         # Show the window
         self.main_window.show()
-        # Start the worker threads
+        # Start the worker thread and the plot refreshes
         self.control_panel.start_worker()
-        self.trace_panel.start_worker()
+        self.trace_panel.start_refresh_timer()
         # Run the event loop
         return self.application.exec()
 
-    def get_trace_panel_message_queue(self) -> Queue:
+    def get_trace_panel_message_queue(self) -> MessageQueue:
         """Get trace panel's message queue."""
         return self.trace_panel.msg_queue
 
-    def get_control_panel_configurator_message_queue(self) -> Queue:
+    def get_control_panel_configurator_message_queue(self) -> MessageQueue:
         """Get control panel's configurator message queue."""
         return self.control_panel.configurator_msg_queue
 
-    def get_control_panel_trace_enable_message_queue(self) -> Queue:
+    def get_control_panel_trace_enable_message_queue(self) -> MessageQueue:
         """Get control panel's queue for trace enable messages."""
         return self.control_panel.trace_enable_msg_queue
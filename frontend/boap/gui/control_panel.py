@@ -7,9 +7,15 @@ from typing import Optional
 
 from PyQt6 import QtCore, QtWidgets
 
-from ..acp import get_acp_stack_handle
 from ..acp.configurator import PlantConfigurator
-from ..acp.messages import BoapAcpMsgId, BoapAcpNodeId, SBoapAcpBallTraceEnable
+from ..acp.message_queue import MessageQueue
+from ..acp.messages import (
+    BoapAcpMsg,
+    BoapAcpMsgId,
+    BoapAcpNodeId,
+    SBoapAcpBallTraceEnable,
+)
+from ..acp.stack import BoapAcp
 from ..defs import EBoapBool_BoolFalse, EBoapBool_BoolTrue, PlantSettings
 from .controller_window import ControllerWindow
 
@@ -20,6 +26,11 @@ class ControlPanel:
     RECEIVE_TIMEOUT = 1
     TRACE_ENABLE_SAMPLING_PERIOD_THRESHOLD = 0.05
 
+    class WorkerSignals(QtCore.QObject):
+        """Signals passing worker thread results to the GUI thread."""
+
+        settings_acked_sig = QtCore.pyqtSignal(object)
+
     def __init__(self, parentWidget: QtWidgets.QWidget) -> None:
         """Initialize the control panel."""
         self.frame = QtWidgets.QFrame(parentWidget)
@@ -38,14 +49,17 @@ class ControlPanel:
         self.__add_widgets_to_layout()
 
         # Create the message queues
-        self.configurator_msg_queue: queue.Queue = queue.Queue()
-        self.trace_enable_msg_queue: queue.Queue = queue.Queue()
+        self.configurator_msg_queue = MessageQueue()
+        self.trace_enable_msg_queue = MessageQueue()
         # Create the new settings queue
         self.new_settings_queue: queue.Queue = queue.Queue()
+        # Settings last acknowledged by the plant
+        self.current_settings: Optional[PlantSettings] = None
 
-        # Create the configurator
-        self.configurator = PlantConfigurator(
-            self.configurator_msg_queue, self.RECEIVE_TIMEOUT
+        # Update the widgets from the GUI thread only
+        self.worker_signals = self.WorkerSignals()
+        self.worker_signals.settings_acked_sig.connect(
+            self.__show_acked_settings
         )
 
         # Create the worker thread
@@ -55,6 +69,20 @@ class ControlPanel:
             daemon=True,
         )
 
+    def attach_acp_stack(self, acp_stack: BoapAcp) -> None:
+        """Attach the ACP stack used to communicate with the plant."""
+        self.acp_stack = acp_stack
+        # Create the configurator
+        self.configurator = PlantConfigurator(
+            acp_stack, self.configurator_msg_queue, self.RECEIVE_TIMEOUT
+        )
+        # Trace enable requests are never mutated by the stack, so build
+        # both variants once and resend the same objects
+        self.trace_enable_requests = {
+            enable: self.__create_trace_enable_request(enable)
+            for enable in (False, True)
+        }
+
     def start_worker(self) -> None:
         """Start the worker thread."""
         self.worker_thread.start()
@@ -63,9 +91,10 @@ class ControlPanel:
         """Worker thread entry point."""
         self.log.debug("Control panel worker thread entered")
         self.log.info("Fetching settings from plant...")
-        self.current_settings = self.configurator.fetch_current_settings()
+        current_settings = self.configurator.fetch_current_settings()
+        self.current_settings = current_settings
         # Initialize the text fields to current plant settings
-        self.__set_new_placeholders_in_text_fields(self.current_settings)
+        self.worker_signals.settings_acked_sig.emit(current_settings)
         while True:
             # Block on the settings queue
             new_settings = self.new_settings_queue.get()
@@ -75,26 +104,35 @@ class ControlPanel:
             )
             # Run ACP transactions
             acked_settings = self.configurator.configure(
-                self.current_settings, new_settings
+                current_settings, new_settings
             )
 
             # On sampling period change
             if (
-                self.current_settings.SamplingPeriod
+                current_settings.SamplingPeriod
                 != acked_settings.SamplingPeriod
             ):
                 # Disable trace if too low a sampling period
                 self.__handle_trace_enable(acked_settings.SamplingPeriod)
 
-            # Set new placeholders
-            self.__set_new_placeholders_in_text_fields(acked_settings)
-            self.current_settings = acked_settings
-            self.log.debug("Clearing the text fields...")
-            # Clear the text fields
-            self.__clear_text_fields()
-            self.log.debug("Unlocking the panel...")
-            # Unlock the panel
-            self.__unlock_panel()
+            current_settings = acked_settings
+            self.current_settings = current_settings
+            # Hand the widget updates over to the GUI thread
+            self.worker_signals.settings_acked_sig.emit(current_settings)
+
+    def __show_acked_settings(self, settings: PlantSettings) -> None:
+        """Show the settings acknowledged by the plant and unlock the panel."""
+        # Repaint the panel once all the fields have been updated
+        self.frame.setUpdatesEnabled(False)
+        # Set new placeholders
+        self.__set_new_placeholders_in_text_fields(settings)
+        self.log.debug("Clearing the text fields...")
+        # Clear the text fields
+        self.__clear_text_fields()
+        self.log.debug("Unlocking the panel...")
+        # Unlock the panel
+        self.__unlock_panel()
+        self.frame.setUpdatesEnabled(True)
 
     def __init_labels(self) -> None:
         """Initialize control panel labels."""
@@ -149,7 +187,10 @@ class ControlPanel:
             # Show the controller window if not already showing
             if not self.controller_window:
                 self.controller_window = ControllerWindow(
-                    width=322, height=247, callback_on_close=__on_close
+                    self.acp_stack,
+                    width=322,
+                    height=247,
+                    callback_on_close=__on_close,
                 )
                 self.controller_window.show()
             else:
@@ -212,54 +253,45 @@ class ControlPanel:
 
     def __parse_plant_settings(self) -> Optional[PlantSettings]:
         """Try parsing the text fields as plant settings."""
+        # Untouched fields fall back to the current settings (shown as
+        # placeholders), so there is nothing to parse before they are known
+        current = self.current_settings
+        if current is None:
+            return None
         try:
             settings = PlantSettings()
-            settings.XAxis.ProportionalGain = (
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["xp"]
-                )
+            settings.XAxis.ProportionalGain = self.__parse_text_field_or(
+                self.text_fields["xp"], current.XAxis.ProportionalGain
             )
-            settings.XAxis.IntegralGain = (
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["xi"]
-                )
+            settings.XAxis.IntegralGain = self.__parse_text_field_or(
+                self.text_fields["xi"], current.XAxis.IntegralGain
             )
-            settings.XAxis.DerivativeGain = (
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["xd"]
-                )
+            settings.XAxis.DerivativeGain = self.__parse_text_field_or(
+                self.text_fields["xd"], current.XAxis.DerivativeGain
             )
             settings.XAxis.FilterOrder = int(
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["xf"]
+                self.__parse_text_field_or(
+                    self.text_fields["xf"], current.XAxis.FilterOrder
                 )
             )
 
-            settings.YAxis.ProportionalGain = (
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["yp"]
-                )
+            settings.YAxis.ProportionalGain = self.__parse_text_field_or(
+                self.text_fields["yp"], current.YAxis.ProportionalGain
             )
-            settings.YAxis.IntegralGain = (
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["yi"]
-                )
+            settings.YAxis.IntegralGain = self.__parse_text_field_or(
+                self.text_fields["yi"], current.YAxis.IntegralGain
             )
-            settings.YAxis.DerivativeGain = (
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["yd"]
-                )
+            settings.YAxis.DerivativeGain = self.__parse_text_field_or(
+                self.text_fields["yd"], current.YAxis.DerivativeGain
             )
             settings.YAxis.FilterOrder = int(
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["yf"]
+                self.__parse_text_field_or(
+                    self.text_fields["yf"], current.YAxis.FilterOrder
                 )
             )
 
-            settings.SamplingPeriod = (
-                self.__parse_text_field_or_get_placeholder(
-                    self.text_fields["sp"]
-                )
+            settings.SamplingPeriod = self.__parse_text_field_or(
+                self.text_fields["sp"], current.SamplingPeriod
             )
 
             # Assert valid values
@@ -275,16 +307,17 @@ class ControlPanel:
         except ValueError:
             return None
 
-    def __parse_text_field_or_get_placeholder(
-        self, text_field: QtWidgets.QLineEdit
+    def __parse_text_field_or(
+        self, text_field: QtWidgets.QLineEdit, fallback: float
     ) -> float:
-        """Parse a text field."""
-        if text_field.text() != "":
+        """Parse a text field or return the fallback value if empty."""
+        text = text_field.text()
+        if text != "":
             # Text field dirty, try parsing the content
-            return float(text_field.text())
+            return float(text)
         else:
-            # Use placeholder value
-            return float(text_field.placeholderText())
+            # Use the value shown as placeholder
+            return fallback
 
     def __set_new_placeholders_in_text_fields(
         self, plantSettings: PlantSettings
@@ -323,21 +356,21 @@ class ControlPanel:
         # Disable the OK button
         self.ok_button.setDisabled(True)
         # Set text fields as read-only
-        for key in self.text_fields:
-            self.text_fields[key].setReadOnly(True)
+        for text_field in self.text_fields.values():
+            text_field.setReadOnly(True)
 
     def __unlock_panel(self) -> None:
         """Unlock the panel, enabling user interaction."""
         # Allow writing to text fields
-        for key in self.text_fields:
-            self.text_fields[key].setReadOnly(False)
+        for text_field in self.text_fields.values():
+            text_field.setReadOnly(False)
         # Reenable the OK button
         self.ok_button.setDisabled(False)
 
     def __clear_text_fields(self) -> None:
         """Clear all text fields."""
-        for key in self.text_fields:
-            self.text_fields[key].clear()
+        for text_field in self.text_fields.values():
+            text_field.clear()
 
     def __handle_trace_enable(self, sampling_period: float) -> None:
         """Disable or reenable trace based on the selected sampling period."""
@@ -348,19 +381,24 @@ class ControlPanel:
             # Reenable tracing
             self.__trace_enable(True)
 
-    def __trace_enable(self, enable: bool) -> None:
-        """Enable or disable tracing plantside."""
-        # Send the request...
-        request = get_acp_stack_handle().msg_create(
+    def __create_trace_enable_request(self, enable: bool) -> BoapAcpMsg:
+        """Create a request enabling or disabling tracing plantside."""
+        request = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_BALL_TRACE_ENABLE,
         )
+        payload = request.get_payload()
+        assert isinstance(payload, SBoapAcpBallTraceEnable)
+        payload.Enable = EBoapBool_BoolTrue if enable else EBoapBool_BoolFalse
+        return request
+
+    def __trace_enable(self, enable: bool) -> None:
+        """Enable or disable tracing plantside."""
+        # Send the request...
+        request = self.trace_enable_requests[enable]
         req_payload = request.get_payload()
         assert isinstance(req_payload, SBoapAcpBallTraceEnable)
-        req_payload.Enable = (
-            EBoapBool_BoolTrue if enable else EBoapBool_BoolFalse
-        )
-        get_acp_stack_handle().msg_send(request)
+        self.acp_stack.msg_send(request)
 
         # ...and wait for response (echo)
         try:
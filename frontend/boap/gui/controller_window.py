@@ -1,52 +1,82 @@
 """Controller window for setting the ball position setpoint."""
 
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 from PyQt6 import QtCore, QtWidgets
 
-from ..acp import get_acp_stack_handle
 from ..acp.messages import BoapAcpMsgId, BoapAcpNodeId, SBoapAcpNewSetpointReq
+from ..acp.stack import BoapAcp
 
 
 class ControllerWindow(QtWidgets.QLabel):
     """Controller window for setting the setpoint."""
 
+    # Minimum interval between setpoint requests in milliseconds
+    SETPOINT_SEND_PERIOD = 20
+
     def __init__(
-        self, width: int, height: int, callback_on_close: Callable
+        self,
+        acp_stack: BoapAcp,
+        width: int,
+        height: int,
+        callback_on_close: Callable,
     ) -> None:
         """Initialize the controller window."""
         super().__init__("Click anywhere to set the ball position")
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.setWindowTitle("Controller")
         self.setFixedSize(width, height)
-        self.touchscreen_width = width
-        self.touchscreen_height = height
+        # Touchscreen origin in window coordinates
+        self.touchscreen_center_x = width / 2
+        self.touchscreen_center_y = height / 2
         self.callback_on_close = callback_on_close
+        self.acp_stack = acp_stack
+
+        # Rate-limit the setpoint requests, only sending the latest setpoint
+        # requested within each period
+        self.pending_setpoint: Optional[Tuple[float, float]] = None
+        self.send_timer = QtCore.QTimer(self)
+        self.send_timer.setSingleShot(True)
+        self.send_timer.setInterval(self.SETPOINT_SEND_PERIOD)
+        self.send_timer.timeout.connect(self.__send_pending_setpoint)
 
     def __map_to_touchscreen_position(
         self, window_x: int, window_y: int
     ) -> Tuple[float, float]:
         """Map window position to plant's touchscreen coordinates."""
-        x = float(window_x - self.touchscreen_width / 2)
-        y = float(self.touchscreen_height / 2 - window_y)
+        x = window_x - self.touchscreen_center_x
+        y = self.touchscreen_center_y - window_y
         return (x, y)
 
-    # Override event handlers
-    def mousePressEvent(self, event: QtCore.QEvent) -> None:
-        """Handle a mouse press event."""
-        # Send a new setpoint request to the plant
-        message = get_acp_stack_handle().msg_create(
+    def __send_pending_setpoint(self) -> None:
+        """Send the pending setpoint request to the plant, if any."""
+        if self.pending_setpoint is None:
+            return
+        x, y = self.pending_setpoint
+        self.pending_setpoint = None
+
+        message = self.acp_stack.msg_create(
             BoapAcpNodeId.BOAP_ACP_NODE_ID_PLANT,
             BoapAcpMsgId.BOAP_ACP_NEW_SETPOINT_REQ,
         )
-        x, y = self.__map_to_touchscreen_position(
-            event.pos().x(), event.pos().y()
-        )
         payload = message.get_payload()
         assert isinstance(payload, SBoapAcpNewSetpointReq)
         payload.SetpointX = x
         payload.SetpointY = y
-        get_acp_stack_handle().msg_send(message)
+        self.acp_stack.msg_send(message)
+        message.release()
+        # Hold off further requests for one period
+        self.send_timer.start()
+
+    # Override event handlers
+    def mousePressEvent(self, event: QtCore.QEvent) -> None:
+        """Handle a mouse press event."""
+        self.pending_setpoint = self.__map_to_touchscreen_position(
+            event.pos().x(), event.pos().y()
+        )
+        # Send right away unless a request has just been sent
+        if not self.send_timer.isActive():
+            self.__send_pending_setpoint()
 
     def closeEvent(self, event: QtCore.QEvent) -> None:
         """Handle a window close event."""
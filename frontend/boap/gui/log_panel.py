@@ -1,6 +1,8 @@
 """Logger panel."""
 
 import logging
+from collections import deque
+from typing import Deque, Optional
 
 from PyQt6 import QtCore, QtWidgets
 
@@ -8,13 +10,17 @@ from PyQt6 import QtCore, QtWidgets
 class LogPanel:
     """Logger panel."""
 
+    MAX_LINES = 1000
+
     def __init__(
         self, parentWidget: QtWidgets.QWidget, debug_mode: bool
     ) -> None:
         """Construct a log panel."""
         # Instantiate a GUI widget
-        self.display = QtWidgets.QTextEdit(parentWidget)
+        self.display = QtWidgets.QPlainTextEdit(parentWidget)
         self.display.setReadOnly(True)
+        # Discard the oldest lines to bound memory use and layout cost
+        self.display.setMaximumBlockCount(self.MAX_LINES)
 
         # Configure loggers
         self.__configure_local_logger(debug_mode)
@@ -24,7 +30,7 @@ class LogPanel:
         """Configure logger for GUI application use."""
         logger = logging.getLogger("boap-gui-logger")
         # Instantiate a formatter
-        formatter = logging.Formatter(
+        formatter = self.LogFormatter(
             fmt="[%(levelname)s] %(asctime)s: %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -51,19 +57,56 @@ class LogPanel:
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
 
+    class LogFormatter(logging.Formatter):
+        """Formatter rendering the timestamp at most once per second."""
+
+        def __init__(self, fmt: str, datefmt: str) -> None:
+            """Initialize the formatter."""
+            super().__init__(fmt=fmt, datefmt=datefmt)
+            # Used under the lock of the single handler owning the formatter
+            self.cached_second = -1
+            self.cached_timestamp = ""
+
+        def formatTime(
+            self, record: logging.LogRecord, datefmt: Optional[str] = None
+        ) -> str:
+            """Return the creation time of a record as a string."""
+            # The date format has a one-second resolution
+            second = int(record.created)
+            if second != self.cached_second:
+                self.cached_timestamp = super().formatTime(record, datefmt)
+                self.cached_second = second
+            return self.cached_timestamp
+
     class LogHandler(logging.Handler, QtCore.QObject):
         """Custom log handler implementation."""
 
-        new_log_entry_sig = QtCore.pyqtSignal(str)
+        new_log_entries_sig = QtCore.pyqtSignal()
 
-        def __init__(self, display: QtWidgets.QTextEdit) -> None:
+        def __init__(self, display: QtWidgets.QPlainTextEdit) -> None:
             """Initialize a custom handler."""
             logging.Handler.__init__(self)
             QtCore.QObject.__init__(self)
             self.display = display
-            self.new_log_entry_sig.connect(self.display.append)
+            # Formatted entries not yet appended to the display
+            self.pending: Deque[str] = deque()
+            self.new_log_entries_sig.connect(self.__flush_pending)
 
         def emit(self, record: logging.LogRecord) -> None:
             """Emit a log record."""
-            msg = self.format(record)
-            self.new_log_entry_sig.emit(msg)
+            # Called with the handler lock held
+            self.pending.append(self.format(record))
+            if len(self.pending) == 1:
+                # Only signal the first entry of a batch, the rest will be
+                # picked up by the same flush
+                self.new_log_entries_sig.emit()
+
+        def __flush_pending(self) -> None:
+            """Append all pending entries to the display."""
+            self.acquire()
+            try:
+                entries = list(self.pending)
+                self.pending.clear()
+            finally:
+                self.release()
+            self.display.appendPlainText("\n".join(entries))
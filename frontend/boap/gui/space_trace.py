@@ -1,7 +1,8 @@
 """Handler of XY-plots of the ball position."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Sequence, Tuple
 
+import numpy as np
 import pyqtgraph as pg
 
 
@@ -25,21 +26,39 @@ class SpaceTrace(pg.PlotWidget):
         ) -> None:
             """Initialize an XY-plot."""
             self.history_length = history_length
-            self.history: List[Dict[str, Any]] = []
+            # Preallocated point history, of which the first count
+            # entries are valid
+            self.history = np.zeros((history_length, 2), dtype=np.float32)
+            self.count = 0
             self.scatter_plot_item = pg.ScatterPlotItem(
                 size=dot_size, brush=pg.mkBrush(color=dot_color)
             )
             plot.addItem(self.scatter_plot_item)
 
-        def update(self, x: float, y: float) -> None:
-            """Update the plot."""
-            if len(self.history) < self.history_length:
-                self.history.append({"pos": [x, y], "data": 1})
-            else:
-                self.history[:-1] = self.history[1:]
-                self.history[-1] = {"pos": [x, y], "data": 1}
-            self.scatter_plot_item.clear()
-            self.scatter_plot_item.addPoints(self.history)
+        def update(self, xs: Sequence[float], ys: Sequence[float]) -> None:
+            """Update the plot with a batch of points."""
+            # Only the newest points fit in the history
+            new_count = min(len(xs), self.history_length)
+            count = self.count
+            # The history is a few points long, so a copy is cheaper than
+            # tracking which points moved
+            previous = self.history[:count].copy()
+            overflow = count + new_count - self.history_length
+            if overflow > 0:
+                # Shift the history left to make room for the new points
+                kept = count - overflow
+                self.history[:kept] = self.history[overflow:count]
+                count = kept
+
+            end = count + new_count
+            self.history[count:end, 0] = xs[-new_count:]
+            self.history[count:end, 1] = ys[-new_count:]
+            self.count = end
+
+            # Skip the redraw if the points did not move (the setpoint
+            # only changes on user input)
+            if not np.array_equal(previous, self.history[:end]):
+                self.scatter_plot_item.setData(pos=self.history[:end])
 
     def __init__(self, history_length: int) -> None:
         """Initialize an XY-plot handler."""
@@ -65,11 +84,11 @@ class SpaceTrace(pg.PlotWidget):
 
     def update(
         self,
-        setpoint_x: float,
-        position_x: float,
-        setpoint_y: float,
-        position_y: float,
+        setpoints_x: Sequence[float],
+        positions_x: Sequence[float],
+        setpoints_y: Sequence[float],
+        positions_y: Sequence[float],
     ) -> None:
-        """Update the plots."""
-        self.setpoint_trace.update(setpoint_x, setpoint_y)
-        self.position_trace.update(position_x, position_y)
+        """Update the plots with a batch of points."""
+        self.setpoint_trace.update(setpoints_x, setpoints_y)
+        self.position_trace.update(positions_x, positions_y)
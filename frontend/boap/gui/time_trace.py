@@ -1,7 +1,8 @@
 """Handler of time-plots of the ball position."""
 
-from typing import List, Tuple
+from typing import Sequence, Tuple
 
+import numpy as np
 import pyqtgraph as pg
 
 
@@ -22,26 +23,40 @@ class TimeTrace(pg.GraphicsLayoutWidget):
         ) -> None:
             """Initialize a time-plot."""
             self.buffer_size = buffer_size
-            self.value_buffer: List[float] = []
-            self.time_buffer: List[int] = []
-            self.curve = plot_item.plot(pen=pg.mkPen(color=color))
-            self.pointer = 0
+            # Preallocated sample buffers, of which the first count
+            # entries are valid
+            self.value_buffer = np.zeros(buffer_size, dtype=np.float32)
+            self.time_buffer = np.zeros(buffer_size, dtype=np.int64)
+            self.count = 0
+            # Samples come from typed payloads and are always finite, so
+            # let pyqtgraph skip checking the whole buffer on every update
+            self.curve = plot_item.plot(
+                pen=pg.mkPen(color=color), skipFiniteCheck=True
+            )
 
-        def update(self, sample_number: int, value: float) -> None:
-            """Update the plot."""
-            if len(self.value_buffer) < self.buffer_size:
-                self.value_buffer.append(value)
-                self.time_buffer.append(sample_number)
-            else:
-                # Shift the buffers one sample left
-                self.value_buffer[:-1] = self.value_buffer[1:]
-                self.value_buffer[-1] = value
-                self.time_buffer[:-1] = self.time_buffer[1:]
-                self.time_buffer[-1] = sample_number
-                self.pointer += 1
-                self.curve.setPos(self.pointer, 0)
+        def update(
+            self, sample_numbers: Sequence[int], values: Sequence[float]
+        ) -> None:
+            """Update the plot with a batch of samples."""
+            count = self.count
+            # Only the newest samples fit in the buffers
+            new_count = min(len(values), self.buffer_size)
+            overflow = count + new_count - self.buffer_size
+            if overflow > 0:
+                # Shift the buffers left to make room for the new samples
+                kept = count - overflow
+                self.value_buffer[:kept] = self.value_buffer[overflow:count]
+                self.time_buffer[:kept] = self.time_buffer[overflow:count]
+                count = kept
+
+            end = count + new_count
+            self.value_buffer[count:end] = values[-new_count:]
+            self.time_buffer[count:end] = sample_numbers[-new_count:]
+            self.count = end
 
-            self.curve.setData(self.time_buffer, self.value_buffer)
+            self.curve.setData(
+                self.time_buffer[: self.count], self.value_buffer[: self.count]
+            )
 
     def __init__(self, buffer_size: int) -> None:
         """Initialize a time-plot handler."""
@@ -51,10 +66,8 @@ class TimeTrace(pg.GraphicsLayoutWidget):
         self.nextRow()
         self.time_trace_plot_y = self.addPlot()
 
-        self.time_trace_plot_x.setClipToView(True)
-        self.time_trace_plot_x.setDownsampling(mode="peak")
-        self.time_trace_plot_y.setClipToView(True)
-        self.time_trace_plot_y.setDownsampling(mode="peak")
+        # Clipping and downsampling are not worth the extra passes over the
+        # data, as the buffers hold fewer samples than there are pixels
 
         self.time_trace_plot_x.setLabel(axis="bottom", text="n")
         self.time_trace_plot_x.setLabel(axis="left", text="x", units="mm")
@@ -86,14 +99,14 @@ class TimeTrace(pg.GraphicsLayoutWidget):
 
     def update(
         self,
-        sample_number: int,
-        setpoint_x: float,
-        position_x: float,
-        setpoint_y: float,
-        position_y: float,
+        sample_numbers: Sequence[int],
+        setpoints_x: Sequence[float],
+        positions_x: Sequence[float],
+        setpoints_y: Sequence[float],
+        positions_y: Sequence[float],
     ) -> None:
-        """Update the plots."""
-        self.traces["setpoint_x"].update(sample_number, setpoint_x)
-        self.traces["setpoint_y"].update(sample_number, setpoint_y)
-        self.traces["position_x"].update(sample_number, position_x)
-        self.traces["position_y"].update(sample_number, position_y)
+        """Update the plots with a batch of samples."""
+        self.traces["setpoint_x"].update(sample_numbers, setpoints_x)
+        self.traces["setpoint_y"].update(sample_numbers, setpoints_y)
+        self.traces["position_x"].update(sample_numbers, positions_x)
+        self.traces["position_y"].update(sample_numbers, positions_y)
@@ -2,19 +2,29 @@
 
 import logging
 import queue
-import threading
+from operator import attrgetter
 
-from PyQt6 import QtWidgets
+from PyQt6 import QtCore, QtWidgets
 
+from ..acp.message_queue import MessageQueue
 from .space_trace import SpaceTrace
 from .time_trace import TimeTrace
 
+# Read all plotted fields of a trace payload in a single call
+_get_trace_fields = attrgetter(
+    "SampleNumber", "SetpointX", "PositionX", "SetpointY", "PositionY"
+)
+
 
 class TracePanel:
     """Panel displaying the ball trace."""
 
     XY_TRACE_BUFSIZE = 3
     TIME_TRACE_BUFSIZE = 200
+    # Upper bound on the number of samples drawn in one go
+    MAX_BATCH_SIZE = TIME_TRACE_BUFSIZE
+    # Plot refresh period in milliseconds
+    REFRESH_PERIOD = 33
 
     def __init__(self, parentWidget: QtWidgets.QWidget) -> None:
         """Initialize the trace panel."""
@@ -46,40 +56,56 @@ class TracePanel:
         self.layout.addWidget(self.selector)
         self.layout.addWidget(self.plot_stack)
 
-        # Create the message queue
-        self.msg_queue: queue.Queue = queue.Queue()
-
-        # Create the worker thread
-        self.worker_thread = threading.Thread(
-            target=self.__trace_worker_entry_point,
-            name="TracePanelWorker",
-            daemon=True,
-        )
-
-    def start_worker(self) -> None:
-        """Start the worker thread."""
-        self.worker_thread.start()
-
-    def __trace_worker_entry_point(self) -> None:
-        """Worker thread entry point."""
-        self.log.debug("Trace worker thread entered")
-
-        while True:
-            # Block on the message queue indefinitely
-            trace_message = self.msg_queue.get()
-
-            trace_payload = trace_message.get_payload()
-
-            self.time_traces.update(
-                sample_number=trace_payload.SampleNumber,
-                setpoint_x=trace_payload.SetpointX,
-                position_x=trace_payload.PositionX,
-                setpoint_y=trace_payload.SetpointY,
-                position_y=trace_payload.PositionY,
-            )
-            self.space_trace.update(
-                setpoint_x=trace_payload.SetpointX,
-                position_x=trace_payload.PositionX,
-                setpoint_y=trace_payload.SetpointY,
-                position_y=trace_payload.PositionY,
+        # Create the message queue, keeping only as many samples as can be
+        # plotted should the GUI stall
+        self.msg_queue = MessageQueue(maxlen=self.TIME_TRACE_BUFSIZE)
+
+        # Redraw the plots periodically from within the Qt event loop
+        self.refresh_timer = QtCore.QTimer(self.frame)
+        self.refresh_timer.setInterval(self.REFRESH_PERIOD)
+        self.refresh_timer.timeout.connect(self.__refresh_plots)
+
+    def start_refresh_timer(self) -> None:
+        """Start refreshing the plots."""
+        self.log.debug("Starting the trace refresh timer...")
+        self.refresh_timer.start()
+
+    def __refresh_plots(self) -> None:
+        """Draw the traces received since the last refresh."""
+        try:
+            trace_messages = self.msg_queue.get_many(
+                self.MAX_BATCH_SIZE, block=False
             )
+        except queue.Empty:
+            return
+
+        samples = [
+            _get_trace_fields(trace_message.get_payload())
+            for trace_message in trace_messages
+        ]
+        # Recycle the messages
+        for trace_message in trace_messages:
+            trace_message.release()
+        # Split the samples into per-field columns
+        (
+            sample_numbers,
+            setpoints_x,
+            positions_x,
+            setpoints_y,
+            positions_y,
+        ) = zip(*samples)
+
+        # Redraw the plots once per batch
+        self.time_traces.update(
+            sample_numbers=sample_numbers,
+            setpoints_x=setpoints_x,
+            positions_x=positions_x,
+            setpoints_y=setpoints_y,
+            positions_y=positions_y,
+        )
+        self.space_trace.update(
+            setpoints_x=setpoints_x,
+            positions_x=positions_x,
+            setpoints_y=setpoints_y,
+            positions_y=positions_y,
+        )